@@ -3,13 +3,7 @@ RAG Digital Twin - A sophisticated AI-powered system implementing
 Retrieval-Augmented Generation for domain-specific knowledge bases.
 """
 
-from .document_processor import DocumentProcessor
-from .embedding_generator import EmbeddingGenerator
-from .context_retriever import ContextRetriever
-from .query_processor import QueryProcessor
-from .rag_pipeline import RAGPipeline
-from .response_generator import ResponseGenerator
-from .vector_store import VectorStore
+import importlib
 
 __version__ = "1.0.0"
 __author__ = "RAG Digital Twin Team"
@@ -23,3 +17,30 @@ __all__ = [
     "ResponseGenerator",
     "RAGPipeline",
 ]
+
+# Components are resolved on first attribute access (PEP 562) so that light
+# consumers such as the CLI argument parsers do not pay for numpy, faiss,
+# and the PDF stack at package import time.
+_LAZY_IMPORTS = {
+    "DocumentProcessor": "document_processor",
+    "EmbeddingGenerator": "embedding_generator",
+    "VectorStore": "vector_store",
+    "QueryProcessor": "query_processor",
+    "ContextRetriever": "context_retriever",
+    "ResponseGenerator": "response_generator",
+    "RAGPipeline": "rag_pipeline",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
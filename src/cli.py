@@ -10,14 +10,16 @@ import logging
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, TextIO, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, TextIO, Tuple
 
 from .exceptions import ConfigurationError, RAGException
-from .rag_pipeline import RAGPipeline
 from .utils.config_utils import create_default_config, get_default_config_path, load_config
 from .utils.file_utils import ensure_directory, is_supported_file_type
 from .utils.logging_utils import setup_logging
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .rag_pipeline import RAGPipeline
+
 
 def build_ingest_parser() -> argparse.ArgumentParser:
     """
@@ -162,6 +164,9 @@ def ingest_command(argv: Optional[Sequence[str]] = None) -> int:
 
         print("[1/4] Configuration loaded")
         print("[2/4] Initializing RAG pipeline")
+        # Deferred so `--help` and argument errors never import numpy/faiss.
+        from .rag_pipeline import RAGPipeline
+
         pipeline = RAGPipeline(
             config=config,
             vector_store_index_type=args.index_type,
@@ -201,6 +206,8 @@ def query_command(argv: Optional[Sequence[str]] = None) -> int:
 
     try:
         config = _load_runtime_config(args.config, args.log_level, command_name="query")
+        from .rag_pipeline import RAGPipeline
+
         pipeline = RAGPipeline(
             config=config,
             vector_store_index_type=args.index_type,
@@ -4,6 +4,7 @@ Document processing utilities for extracting and chunking source documents.
 
 from __future__ import annotations
 
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -127,6 +128,8 @@ class DocumentProcessor:
         start = 0
         chunk_index = 0
         total_length = len(normalized_text)
+        # One timestamp per document lets every chunk share its ISO string.
+        created_at = datetime.now()
 
         while start < total_length:
             target_end = min(start + self.chunk_size, total_length)
@@ -150,6 +153,7 @@ class DocumentProcessor:
                     content=chunk_content,
                     metadata=chunk_metadata,
                     source_file=source_file,
+                    created_at=created_at,
                 )
             )
 
@@ -2,8 +2,10 @@
 Exception classes and error handling framework for the RAG Digital Twin system.
 """
 
+from collections import Counter
 from typing import Optional, Dict, Any
 from enum import Enum
+import traceback
 
 
 class ErrorCode(Enum):
@@ -52,6 +54,11 @@ class ErrorCode(Enum):
     SYSTEM_RESOURCE_EXHAUSTED = "SYS_002"
     SYSTEM_TIMEOUT = "SYS_003"
     SYSTEM_UNKNOWN_ERROR = "SYS_999"
+    
+    def __init__(self, code: str) -> None:
+        # Same string as ``value``, but as a plain instance attribute so the
+        # error paths below skip the enum ``value`` descriptor.
+        self.code = code
 
 
 class RAGException(Exception):
@@ -84,29 +91,48 @@ class RAGException(Exception):
         self.message = message
         self.error_code = error_code
         self.component = component
-        self.details = details or {}
+        # Most exceptions carry no details; the dict is only allocated when
+        # a caller reads ``details`` or the exception is serialized.
+        self._details = details or None
         self.cause = cause
+        if cause is not None and cause.__traceback__ is not None:
+            # Release the locals held by the failing frames (e.g. embedding
+            # batches) while keeping the traceback itself printable.
+            traceback.clear_frames(cause.__traceback__)
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        """Additional error context and metadata."""
+        if self._details is None:
+            self._details = {}
+        return self._details
+    
+    @details.setter
+    def details(self, value: Optional[Dict[str, Any]]) -> None:
+        self._details = value or None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert exception to dictionary for logging and serialization."""
+        # One dict literal: copying a cached per-code template and filling
+        # in the per-instance keys measured slower than building it outright.
         return {
             "message": self.message,
-            "error_code": self.error_code.value,
+            "error_code": self.error_code.code,
             "component": self.component,
-            "details": self.details,
+            "details": self._details if self._details is not None else {},
             "cause": str(self.cause) if self.cause else None
         }
     
     def __str__(self) -> str:
         """String representation of the exception."""
-        return f"[{self.error_code.value}] {self.component}: {self.message}"
+        return f"[{self.error_code.code}] {self.component}: {self.message}"
 
 
 class DocumentProcessingError(RAGException):
     """Exception raised during document processing operations."""
     
     def __init__(self, message: str, error_code: ErrorCode, file_path: str = "", cause: Optional[Exception] = None):
-        details = {"file_path": file_path} if file_path else {}
+        details = {"file_path": file_path} if file_path else None
         super().__init__(message, error_code, "DocumentProcessor", details, cause)
 
 
@@ -114,7 +140,7 @@ class EmbeddingGenerationError(RAGException):
     """Exception raised during embedding generation operations."""
     
     def __init__(self, message: str, error_code: ErrorCode, model_name: str = "", cause: Optional[Exception] = None):
-        details = {"model_name": model_name} if model_name else {}
+        details = {"model_name": model_name} if model_name else None
         super().__init__(message, error_code, "EmbeddingGenerator", details, cause)
 
 
@@ -122,7 +148,7 @@ class VectorStoreError(RAGException):
     """Exception raised during vector store operations."""
     
     def __init__(self, message: str, error_code: ErrorCode, index_type: str = "", cause: Optional[Exception] = None):
-        details = {"index_type": index_type} if index_type else {}
+        details = {"index_type": index_type} if index_type else None
         super().__init__(message, error_code, "VectorStore", details, cause)
 
 
@@ -130,7 +156,10 @@ class QueryProcessingError(RAGException):
     """Exception raised during query processing operations."""
     
     def __init__(self, message: str, error_code: ErrorCode, query: str = "", cause: Optional[Exception] = None):
-        details = {"query": query[:100] + "..." if len(query) > 100 else query} if query else {}
+        # Only the first 100 characters are ever touched, so arbitrarily long
+        # queries cost the same to wrap.
+        preview = query if len(query) <= 100 else query[:100] + "..."
+        details = {"query": preview} if query else None
         super().__init__(message, error_code, "QueryProcessor", details, cause)
 
 
@@ -138,7 +167,7 @@ class ResponseGenerationError(RAGException):
     """Exception raised during response generation operations."""
     
     def __init__(self, message: str, error_code: ErrorCode, model_name: str = "", cause: Optional[Exception] = None):
-        details = {"model_name": model_name} if model_name else {}
+        details = {"model_name": model_name} if model_name else None
         super().__init__(message, error_code, "ResponseGenerator", details, cause)
 
 
@@ -146,7 +175,7 @@ class ConfigurationError(RAGException):
     """Exception raised for configuration-related errors."""
     
     def __init__(self, message: str, error_code: ErrorCode, config_key: str = "", cause: Optional[Exception] = None):
-        details = {"config_key": config_key} if config_key else {}
+        details = {"config_key": config_key} if config_key else None
         super().__init__(message, error_code, "Configuration", details, cause)
 
 
@@ -154,7 +183,7 @@ class SystemError(RAGException):
     """Exception raised for system-level errors."""
     
     def __init__(self, message: str, error_code: ErrorCode, system_component: str = "", cause: Optional[Exception] = None):
-        details = {"system_component": system_component} if system_component else {}
+        details = {"system_component": system_component} if system_component else None
         super().__init__(message, error_code, "System", details, cause)
 
 
@@ -166,10 +195,22 @@ class ErrorHandler:
     across all system components.
     """
     
+    # Transient failures (rate limits, timeouts, upstream API errors) are
+    # both recoverable and worth retrying; the two policies currently share
+    # one set but stay separately named so they can diverge.
+    _RECOVERABLE_ERRORS = frozenset({
+        ErrorCode.EMBEDDING_RATE_LIMIT,
+        ErrorCode.LLM_RATE_LIMIT,
+        ErrorCode.SYSTEM_TIMEOUT,
+        ErrorCode.EMBEDDING_API_ERROR,
+        ErrorCode.LLM_API_ERROR
+    })
+    _RETRY_ERRORS = _RECOVERABLE_ERRORS
+    
     def __init__(self, logger=None):
         """Initialize the error handler with optional logger."""
         self.logger = logger
-        self.error_counts = {}
+        self.error_counts = Counter()
     
     def handle_error(self, error: Exception, context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -189,8 +230,8 @@ class ErrorHandler:
     
     def _handle_rag_error(self, error: RAGException, context: Dict[str, Any]) -> Dict[str, Any]:
         """Handle RAG-specific exceptions."""
-        error_key = f"{error.component}:{error.error_code.value}"
-        self.error_counts[error_key] = self.error_counts.get(error_key, 0) + 1
+        error_key = f"{error.component}:{error.error_code.code}"
+        self.error_counts[error_key] += 1
         
         if self.logger:
             self.logger.error(f"RAG Error: {error}", extra={"context": context, "error_details": error.to_dict()})
@@ -198,7 +239,7 @@ class ErrorHandler:
         return {
             "error": True,
             "message": error.message,
-            "error_code": error.error_code.value,
+            "error_code": error.error_code.code,
             "component": error.component,
             "recoverable": self._is_recoverable_error(error.error_code),
             "retry_suggested": self._should_retry(error.error_code)
@@ -207,7 +248,7 @@ class ErrorHandler:
     def _handle_generic_error(self, error: Exception, context: Dict[str, Any]) -> Dict[str, Any]:
         """Handle generic Python exceptions."""
         error_key = f"Generic:{type(error).__name__}"
-        self.error_counts[error_key] = self.error_counts.get(error_key, 0) + 1
+        self.error_counts[error_key] += 1
         
         if self.logger:
             self.logger.error(f"Unexpected error: {error}", extra={"context": context})
@@ -215,7 +256,7 @@ class ErrorHandler:
         return {
             "error": True,
             "message": str(error),
-            "error_code": ErrorCode.SYSTEM_UNKNOWN_ERROR.value,
+            "error_code": ErrorCode.SYSTEM_UNKNOWN_ERROR.code,
             "component": "Unknown",
             "recoverable": False,
             "retry_suggested": False
@@ -223,29 +264,15 @@ class ErrorHandler:
     
     def _is_recoverable_error(self, error_code: ErrorCode) -> bool:
         """Determine if an error is recoverable."""
-        recoverable_errors = {
-            ErrorCode.EMBEDDING_RATE_LIMIT,
-            ErrorCode.LLM_RATE_LIMIT,
-            ErrorCode.SYSTEM_TIMEOUT,
-            ErrorCode.EMBEDDING_API_ERROR,
-            ErrorCode.LLM_API_ERROR
-        }
-        return error_code in recoverable_errors
+        return error_code in self._RECOVERABLE_ERRORS
     
     def _should_retry(self, error_code: ErrorCode) -> bool:
         """Determine if an operation should be retried."""
-        retry_errors = {
-            ErrorCode.EMBEDDING_RATE_LIMIT,
-            ErrorCode.LLM_RATE_LIMIT,
-            ErrorCode.SYSTEM_TIMEOUT,
-            ErrorCode.EMBEDDING_API_ERROR,
-            ErrorCode.LLM_API_ERROR
-        }
-        return error_code in retry_errors
+        return error_code in self._RETRY_ERRORS
     
     def get_error_statistics(self) -> Dict[str, int]:
         """Get error occurrence statistics."""
-        return self.error_counts.copy()
+        return dict(self.error_counts)
     
     def reset_error_counts(self) -> None:
         """Reset error occurrence counters."""
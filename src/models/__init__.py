@@ -2,11 +2,7 @@
 Core data models for the RAG Digital Twin system.
 """
 
-from .document_chunk import DocumentChunk
-from .embedding_metadata import EmbeddingMetadata
-from .rag_config import RAGConfig
-from .search_results import SearchResults, QueryResults, RetrievedContext, GeneratedResponse
-from .system_status import SystemStatus, IngestionResults
+import importlib
 
 __all__ = [
     "DocumentChunk",
@@ -18,4 +14,32 @@ __all__ = [
     "GeneratedResponse",
     "SystemStatus",
     "IngestionResults"
-]
\ No newline at end of file
+]
+
+# Each model module is imported on first attribute access (PEP 562), so a
+# consumer that only needs RAGConfig does not load every other model.
+_LAZY_IMPORTS = {
+    "DocumentChunk": "document_chunk",
+    "EmbeddingMetadata": "embedding_metadata",
+    "RAGConfig": "rag_config",
+    "SearchResults": "search_results",
+    "QueryResults": "search_results",
+    "RetrievedContext": "search_results",
+    "GeneratedResponse": "search_results",
+    "SystemStatus": "system_status",
+    "IngestionResults": "system_status",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
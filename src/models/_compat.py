@@ -0,0 +1,10 @@
+"""
+Interpreter compatibility helpers shared by the data models.
+"""
+
+import sys
+from typing import Any, Dict
+
+# ``@dataclass(slots=True)`` drops the per-instance ``__dict__`` for models
+# that are allocated once per chunk; the option only exists on Python 3.10+.
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
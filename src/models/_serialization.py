@@ -0,0 +1,136 @@
+"""
+Serialization helpers shared by the data models.
+"""
+
+from dataclasses import MISSING, fields
+from datetime import datetime
+from typing import Any, Callable, Iterable, Optional, Tuple, Type, TypeVar
+
+_ModelT = TypeVar("_ModelT")
+
+# Most recently formatted datetime and its ISO string. Chunks produced from
+# one document share a single ``created_at`` object, so consecutive to_dict()
+# calls reuse the string instead of re-running isoformat(). The pair is
+# swapped as one tuple so concurrent readers never see a mismatched entry.
+_last_isoformat: Tuple[Optional[datetime], str] = (None, "")
+
+
+def isoformat(value: datetime) -> str:
+    """Return ``value.isoformat()``, reusing the last result for the same object."""
+    global _last_isoformat
+    cached_value, cached_text = _last_isoformat
+    if cached_value is value:
+        return cached_text
+    text = value.isoformat()
+    _last_isoformat = (value, text)
+    return text
+
+
+def generated_to_dict(
+    datetime_fields: Iterable[str] = (),
+    doc: str = "Convert the model to a dictionary for serialization.",
+    name: str = "to_dict",
+) -> Callable[[Type[_ModelT]], Type[_ModelT]]:
+    """
+    Class decorator that adds a ``to_dict`` compiled from the dataclass fields.
+    
+    The generated method is a single dict literal over the public fields,
+    with ``datetime_fields`` rendered through :func:`isoformat`, so the key
+    list can never drift from the field list. Apply it above ``@dataclass``;
+    ``name`` installs the method under another attribute when the class wraps
+    it (e.g. to cache the result).
+    """
+    datetime_names = frozenset(datetime_fields)
+
+    def decorate(cls: Type[_ModelT]) -> Type[_ModelT]:
+        entries = []
+        for model_field in fields(cls):
+            field_name = model_field.name
+            if field_name.startswith("_"):
+                continue
+            if field_name in datetime_names:
+                expression = f"isoformat(self.{field_name})"
+            else:
+                expression = f"self.{field_name}"
+            entries.append(f"        {field_name!r}: {expression},")
+
+        source = f"def {name}(self):\n    return {{\n" + "\n".join(entries) + "\n    }\n"
+        namespace = {"isoformat": isoformat}
+        exec(compile(source, f"<generated {cls.__name__}.{name}>", "exec"), namespace)
+
+        method = namespace[name]
+        method.__module__ = cls.__module__
+        method.__qualname__ = f"{cls.__qualname__}.{name}"
+        method.__doc__ = doc
+        setattr(cls, name, method)
+        return cls
+
+    return decorate
+
+
+def _parse_datetime(value: Any, default_factory: Optional[Callable[[], datetime]] = None) -> Any:
+    """Parse an ISO string; ``None`` falls back to ``default_factory`` when given."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    if value is None and default_factory is not None:
+        return default_factory()
+    return value
+
+
+def generated_from_dict(
+    datetime_fields: Iterable[str] = (),
+    doc: str = "Create the model from a dictionary.",
+) -> Callable[[Type[_ModelT]], Type[_ModelT]]:
+    """
+    Class decorator that adds a ``from_dict`` classmethod compiled from the fields.
+    
+    The generated method is one positional constructor call over the
+    ``__init__`` fields: required fields are read with ``data[key]``, missing
+    optional ones fall back to the field default (or a fresh
+    ``default_factory()`` value), and ``datetime_fields`` are parsed from ISO
+    strings, with ``None`` treated as missing. Apply it above ``@dataclass``.
+    """
+    datetime_names = frozenset(datetime_fields)
+
+    def decorate(cls: Type[_ModelT]) -> Type[_ModelT]:
+        namespace: dict = {"_parse_datetime": _parse_datetime}
+        arguments = []
+        for model_field in fields(cls):
+            if not model_field.init:
+                continue
+            field_name = model_field.name
+            key = repr(field_name)
+            factory_name = f"_factory_{field_name}"
+            default_name = f"_default_{field_name}"
+            if model_field.default_factory is not MISSING:
+                namespace[factory_name] = model_field.default_factory
+                fallback = f"{factory_name}()"
+            elif model_field.default is not MISSING:
+                namespace[default_name] = model_field.default
+                fallback = default_name
+            else:
+                fallback = None
+
+            if field_name in datetime_names:
+                factory = factory_name if model_field.default_factory is not MISSING else "None"
+                lookup = f"data.get({key})" if fallback is not None else f"data[{key}]"
+                expression = f"_parse_datetime({lookup}, {factory})"
+            elif fallback is None:
+                expression = f"data[{key}]"
+            elif model_field.default_factory is not MISSING:
+                expression = f"data[{key}] if {key} in data else {fallback}"
+            else:
+                expression = f"data.get({key}, {fallback})"
+            arguments.append(f"        {expression},")
+
+        source = "def from_dict(cls, data):\n    return cls(\n" + "\n".join(arguments) + "\n    )\n"
+        exec(compile(source, f"<generated {cls.__name__}.from_dict>", "exec"), namespace)
+
+        method = namespace["from_dict"]
+        method.__module__ = cls.__module__
+        method.__qualname__ = f"{cls.__qualname__}.from_dict"
+        method.__doc__ = doc
+        setattr(cls, "from_dict", classmethod(method))
+        return cls
+
+    return decorate
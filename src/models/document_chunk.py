@@ -4,11 +4,22 @@ DocumentChunk data model for representing processed document segments.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Any, Optional
-import uuid
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple
+import secrets
+import sys
+from ._compat import DATACLASS_SLOTS
+from ._serialization import generated_from_dict, generated_to_dict
 
 
-@dataclass
+@generated_to_dict(
+    datetime_fields=("created_at",),
+    doc="Convert the document chunk to a dictionary for serialization.",
+)
+@generated_from_dict(
+    datetime_fields=("created_at",),
+    doc="Create a DocumentChunk from a dictionary.",
+)
+@dataclass(**DATACLASS_SLOTS)
 class DocumentChunk:
     """
     Represents a chunk of text extracted from a document with associated metadata.
@@ -19,9 +30,15 @@ class DocumentChunk:
     content: str
     metadata: Dict[str, Any] = field(default_factory=dict)
     source_file: str = ""
-    chunk_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    # 128 random bits as 32 hex characters.
+    chunk_id: str = field(default_factory=lambda: secrets.token_hex(16))
     embedding_id: Optional[int] = None
     created_at: datetime = field(default_factory=datetime.now)
+    # (content, max_length, preview) of the last preview built; the content
+    # reference lets the cache notice when ``content`` is reassigned.
+    _preview_cache: Optional[Tuple[str, int, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def __post_init__(self):
         """Validate the document chunk after initialization."""
@@ -29,42 +46,31 @@ class DocumentChunk:
             raise ValueError("Document chunk content cannot be empty")
         if not self.source_file:
             raise ValueError("Source file must be specified")
+        # Every chunk of a document repeats the same path; intern it so a
+        # large ingest keeps one copy per file instead of one per chunk.
+        if isinstance(self.source_file, str):
+            self.source_file = sys.intern(self.source_file)
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert the document chunk to a dictionary for serialization."""
-        return {
-            "content": self.content,
-            "metadata": self.metadata,
-            "source_file": self.source_file,
-            "chunk_id": self.chunk_id,
-            "embedding_id": self.embedding_id,
-            "created_at": self.created_at.isoformat()
-        }
-    
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'DocumentChunk':
-        """Create a DocumentChunk from a dictionary."""
-        # Parse datetime if it's a string
-        created_at = data.get("created_at")
-        if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at)
-        elif created_at is None:
-            created_at = datetime.now()
-            
-        return cls(
-            content=data["content"],
-            metadata=data.get("metadata", {}),
-            source_file=data["source_file"],
-            chunk_id=data.get("chunk_id", str(uuid.uuid4())),
-            embedding_id=data.get("embedding_id"),
-            created_at=created_at
-        )
+    if TYPE_CHECKING:  # pragma: no cover - generated by the serialization decorators
+        def to_dict(self) -> Dict[str, Any]: ...
+        
+        @classmethod
+        def from_dict(cls, data: Dict[str, Any]) -> 'DocumentChunk': ...
     
     def get_content_preview(self, max_length: int = 100) -> str:
         """Get a preview of the content for display purposes."""
-        if len(self.content) <= max_length:
-            return self.content
-        return self.content[:max_length] + "..."
+        content = self.content
+        # Short content is its own preview; nothing to build or cache.
+        if len(content) <= max_length:
+            return content
+        
+        cached = self._preview_cache
+        if cached is not None and cached[0] is content and cached[1] == max_length:
+            return cached[2]
+        
+        preview = content[:max_length] + "..."
+        self._preview_cache = (content, max_length, preview)
+        return preview
     
     def __str__(self) -> str:
         """String representation of the document chunk."""
@@ -4,10 +4,21 @@ EmbeddingMetadata data model for tracking embedding information.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Any
+import sys
+from typing import TYPE_CHECKING, Dict, Any
+from ._compat import DATACLASS_SLOTS
+from ._serialization import generated_from_dict, generated_to_dict
 
 
-@dataclass
+@generated_to_dict(
+    datetime_fields=("created_at",),
+    doc="Convert the embedding metadata to a dictionary for serialization.",
+)
+@generated_from_dict(
+    datetime_fields=("created_at",),
+    doc="Create EmbeddingMetadata from a dictionary.",
+)
+@dataclass(**DATACLASS_SLOTS)
 class EmbeddingMetadata:
     """
     Metadata associated with vector embeddings in the system.
@@ -29,45 +40,25 @@ class EmbeddingMetadata:
             raise ValueError("Source file cannot be empty")
         if not self.embedding_model:
             raise ValueError("Embedding model cannot be empty")
+        # Shared across every embedding of a file / run; keep one copy each.
+        if isinstance(self.source_file, str):
+            self.source_file = sys.intern(self.source_file)
+        if isinstance(self.embedding_model, str):
+            self.embedding_model = sys.intern(self.embedding_model)
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert the embedding metadata to a dictionary for serialization."""
-        return {
-            "chunk_id": self.chunk_id,
-            "source_file": self.source_file,
-            "content_preview": self.content_preview,
-            "embedding_model": self.embedding_model,
-            "created_at": self.created_at.isoformat()
-        }
-    
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'EmbeddingMetadata':
-        """Create EmbeddingMetadata from a dictionary."""
-        created_at = data.get("created_at")
-        if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at)
-        elif created_at is None:
-            created_at = datetime.now()
-            
-        return cls(
-            chunk_id=data["chunk_id"],
-            source_file=data["source_file"],
-            content_preview=data["content_preview"],
-            embedding_model=data["embedding_model"],
-            created_at=created_at
-        )
+    if TYPE_CHECKING:  # pragma: no cover - generated by the serialization decorators
+        def to_dict(self) -> Dict[str, Any]: ...
+        
+        @classmethod
+        def from_dict(cls, data: Dict[str, Any]) -> 'EmbeddingMetadata': ...
     
     @classmethod
     def from_document_chunk(cls, chunk: 'DocumentChunk', embedding_model: str, preview_length: int = 100) -> 'EmbeddingMetadata':
         """Create EmbeddingMetadata from a DocumentChunk."""
-        content_preview = chunk.content[:preview_length]
-        if len(chunk.content) > preview_length:
-            content_preview += "..."
-            
         return cls(
             chunk_id=chunk.chunk_id,
             source_file=chunk.source_file,
-            content_preview=content_preview,
+            content_preview=chunk.get_content_preview(preview_length),
             embedding_model=embedding_model
         )
     
@@ -2,12 +2,41 @@
 RAGConfig data model for system configuration management.
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, Any, List
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, AbstractSet, Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+import copy
+import functools
 import json
+import os
+import sys
 
+from ._compat import DATACLASS_SLOTS
+from ._serialization import generated_to_dict
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+@functools.lru_cache(maxsize=32)
+def _load_json_config(file_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a JSON configuration file, memoized on its path, mtime, and size.
+    
+    The mtime and size arguments are only part of the cache key so that an
+    edited file is re-read; callers must copy the result before handing it
+    to a mutable RAGConfig.
+    """
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@generated_to_dict(doc="Build a fresh dictionary of the configuration fields.", name="_build_dict")
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class RAGConfig:
     """
     Configuration settings for the RAG Digital Twin system.
@@ -48,8 +77,15 @@ class RAGConfig:
     embeddings_directory: str = "embeddings"
     logs_directory: str = "logs"
     
+    # Lazily built to_dict() payload; safe to cache because the config is frozen.
+    _as_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Validate configuration after initialization."""
+        for name in _INTERNED_FIELDS:
+            value = getattr(self, name)
+            if isinstance(value, str):
+                object.__setattr__(self, name, sys.intern(value))
         self.validate()
     
     def validate(self) -> bool:
@@ -67,12 +103,9 @@ class RAGConfig:
         # Import lazily to avoid coupling model imports to provider initialization.
         from src.providers import ProviderFactory
 
-        valid_embedding_providers = ProviderFactory.get_supported_embedding_providers()
-        valid_llm_providers = ProviderFactory.get_supported_llm_providers()
-
-        if self.embedding_provider not in valid_embedding_providers:
+        if not ProviderFactory.is_embedding_provider_supported(self.embedding_provider):
             errors.append(f"Invalid embedding provider: {self.embedding_provider}")
-        if self.llm_provider not in valid_llm_providers:
+        if not ProviderFactory.is_llm_provider_supported(self.llm_provider):
             errors.append(f"Invalid LLM provider: {self.llm_provider}")
         if not self.embedding_model:
             errors.append("Embedding model must be specified")
@@ -128,31 +161,49 @@ class RAGConfig:
         
         return True
     
+    def _validate_fields(self, changed_fields: AbstractSet[str]) -> bool:
+        """
+        Run only the validation rules that read any of ``changed_fields``.
+        
+        Skipping the other rules is only sound when the rest of the config
+        was already validated, as in ``update``; ``validate`` checks
+        everything inline instead, which is cheaper than walking the table.
+        """
+        if len(changed_fields) == 1:
+            rules = _RULES_BY_FIELD.get(next(iter(changed_fields)), ())
+        else:
+            rules = [rule for rule in _VALIDATION_RULES if not rule[0].isdisjoint(changed_fields)]
+        errors = [message.format(self) for _watched, is_valid, message in rules if not is_valid(self)]
+        if errors:
+            raise ValueError("Configuration validation failed: " + "; ".join(errors))
+
+        from src.providers import ProviderFactory
+
+        if not _EMBEDDING_REQUEST_FIELDS.isdisjoint(changed_fields):
+            ProviderFactory.validate_embedding_request(
+                provider_name=self.embedding_provider,
+                provider_config=self.embedding_provider_config,
+                fallback_providers=self.embedding_fallbacks,
+            )
+        if not _LLM_REQUEST_FIELDS.isdisjoint(changed_fields):
+            ProviderFactory.validate_llm_request(
+                provider_name=self.llm_provider,
+                provider_config=self.llm_provider_config,
+                fallback_providers=self.llm_fallbacks,
+            )
+        
+        return True
+    
+    if TYPE_CHECKING:  # pragma: no cover - generated by @generated_to_dict
+        def _build_dict(self) -> Dict[str, Any]: ...
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert the configuration to a dictionary for serialization."""
-        return {
-            "embedding_provider": self.embedding_provider,
-            "embedding_model": self.embedding_model,
-            "embedding_provider_config": self.embedding_provider_config,
-            "embedding_fallbacks": self.embedding_fallbacks,
-            "llm_provider": self.llm_provider,
-            "llm_model": self.llm_model,
-            "llm_provider_config": self.llm_provider_config,
-            "llm_fallbacks": self.llm_fallbacks,
-            "chunk_size": self.chunk_size,
-            "chunk_overlap": self.chunk_overlap,
-            "max_context_length": self.max_context_length,
-            "top_k_results": self.top_k_results,
-            "similarity_threshold": self.similarity_threshold,
-            "max_response_tokens": self.max_response_tokens,
-            "temperature": self.temperature,
-            "batch_size": self.batch_size,
-            "max_retries": self.max_retries,
-            "timeout_seconds": self.timeout_seconds,
-            "data_directory": self.data_directory,
-            "embeddings_directory": self.embeddings_directory,
-            "logs_directory": self.logs_directory
-        }
+        cached = self._as_dict
+        if cached is None:
+            cached = self._build_dict()
+            object.__setattr__(self, "_as_dict", cached)
+        return dict(cached)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'RAGConfig':
@@ -162,21 +213,107 @@ class RAGConfig:
     @classmethod
     def from_json_file(cls, file_path: str) -> 'RAGConfig':
         """Load configuration from a JSON file."""
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-        return cls.from_dict(data)
+        resolved_path = os.path.abspath(file_path)
+        stat_result = os.stat(resolved_path)
+        data = _load_json_config(resolved_path, stat_result.st_mtime_ns, stat_result.st_size)
+        return cls.from_dict(copy.deepcopy(data))
     
     def to_json_file(self, file_path: str) -> None:
         """Save configuration to a JSON file."""
+        if orjson is not None:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            return
         with open(file_path, 'w') as f:
             json.dump(self.to_dict(), f, indent=2)
     
     def update(self, **kwargs) -> 'RAGConfig':
-        """Create a new configuration with updated parameters."""
-        current_dict = self.to_dict()
-        current_dict.update(kwargs)
-        return RAGConfig.from_dict(current_dict)
+        """
+        Create a new configuration with updated parameters.
+        
+        Only the validation rules that read an updated field are re-run;
+        every other setting was already validated on this instance.
+        """
+        unknown_fields = kwargs.keys() - _FIELD_NAMES
+        if unknown_fields:
+            raise TypeError(f"Unknown RAGConfig fields: {', '.join(sorted(unknown_fields))}")
+
+        # Field-wise copy instead of dataclasses.replace(), which would re-run
+        # __post_init__ and therefore the full validation; copy.copy() goes
+        # through __reduce_ex__ and is several times slower on slotted classes.
+        set_field = object.__setattr__
+        updated = object.__new__(type(self))
+        for name in _FIELD_NAMES:
+            set_field(updated, name, getattr(self, name))
+        for name, value in kwargs.items():
+            if name in _INTERNED_FIELDS and isinstance(value, str):
+                value = sys.intern(value)
+            set_field(updated, name, value)
+        set_field(updated, "_as_dict", None)
+        updated._validate_fields(kwargs.keys())
+        return updated
     
     def __str__(self) -> str:
         """String representation of the configuration."""
         return f"RAGConfig(embedding={self.embedding_provider}/{self.embedding_model}, llm={self.llm_provider}/{self.llm_model})"
+
+
+# Provider names are checked against the live ProviderFactory registry (a
+# dict lookup), not a frozen set, so providers registered at runtime validate.
+def _is_supported_embedding_provider(provider_name: str) -> bool:
+    from src.providers import ProviderFactory
+
+    return ProviderFactory.is_embedding_provider_supported(provider_name)
+
+
+def _is_supported_llm_provider(provider_name: str) -> bool:
+    from src.providers import ProviderFactory
+
+    return ProviderFactory.is_llm_provider_supported(provider_name)
+
+
+# Partial-validation table for ``update``; ``validate`` mirrors these checks
+# inline. Entries are (fields the rule reads, predicate that is True when
+# valid, error message), and messages are ``str.format`` templates applied to
+# the config instance.
+_VALIDATION_RULES: Tuple[Tuple[FrozenSet[str], Callable[[RAGConfig], bool], str], ...] = (
+    (frozenset({"embedding_provider"}), lambda c: _is_supported_embedding_provider(c.embedding_provider),
+     "Invalid embedding provider: {0.embedding_provider}"),
+    (frozenset({"llm_provider"}), lambda c: _is_supported_llm_provider(c.llm_provider),
+     "Invalid LLM provider: {0.llm_provider}"),
+    (frozenset({"embedding_model"}), lambda c: bool(c.embedding_model), "Embedding model must be specified"),
+    (frozenset({"llm_model"}), lambda c: bool(c.llm_model), "LLM model must be specified"),
+    (frozenset({"embedding_provider_config"}), lambda c: isinstance(c.embedding_provider_config, dict),
+     "Embedding provider config must be a dictionary"),
+    (frozenset({"llm_provider_config"}), lambda c: isinstance(c.llm_provider_config, dict),
+     "LLM provider config must be a dictionary"),
+    (frozenset({"embedding_fallbacks"}), lambda c: isinstance(c.embedding_fallbacks, list),
+     "Embedding fallbacks must be a list"),
+    (frozenset({"llm_fallbacks"}), lambda c: isinstance(c.llm_fallbacks, list), "LLM fallbacks must be a list"),
+    (frozenset({"chunk_size"}), lambda c: c.chunk_size > 0, "Chunk size must be positive"),
+    (frozenset({"chunk_overlap"}), lambda c: c.chunk_overlap >= 0, "Chunk overlap cannot be negative"),
+    (frozenset({"chunk_size", "chunk_overlap"}), lambda c: c.chunk_overlap < c.chunk_size,
+     "Chunk overlap must be less than chunk size"),
+    (frozenset({"max_context_length"}), lambda c: c.max_context_length > 0, "Max context length must be positive"),
+    (frozenset({"top_k_results"}), lambda c: c.top_k_results > 0, "Top-k results must be positive"),
+    (frozenset({"similarity_threshold"}), lambda c: 0.0 <= c.similarity_threshold <= 1.0,
+     "Similarity threshold must be between 0.0 and 1.0"),
+    (frozenset({"max_response_tokens"}), lambda c: c.max_response_tokens > 0, "Max response tokens must be positive"),
+    (frozenset({"temperature"}), lambda c: 0.0 <= c.temperature <= 2.0, "Temperature must be between 0.0 and 2.0"),
+    (frozenset({"batch_size"}), lambda c: c.batch_size > 0, "Batch size must be positive"),
+    (frozenset({"max_retries"}), lambda c: c.max_retries >= 0, "Max retries cannot be negative"),
+    (frozenset({"timeout_seconds"}), lambda c: c.timeout_seconds > 0, "Timeout seconds must be positive"),
+)
+
+# Rules per field, in table order, so the common single-field update() skips
+# the scan over every rule.
+_RULES_BY_FIELD: Dict[str, Tuple[Tuple[FrozenSet[str], Callable[[RAGConfig], bool], str], ...]] = {
+    name: tuple(rule for rule in _VALIDATION_RULES if name in rule[0])
+    for name in frozenset().union(*(rule[0] for rule in _VALIDATION_RULES))
+}
+
+# Provider and model names are copied onto every embedding/response record.
+_INTERNED_FIELDS = ("embedding_provider", "embedding_model", "llm_provider", "llm_model")
+_EMBEDDING_REQUEST_FIELDS = frozenset({"embedding_provider", "embedding_provider_config", "embedding_fallbacks"})
+_LLM_REQUEST_FIELDS = frozenset({"llm_provider", "llm_provider_config", "llm_fallbacks"})
+_FIELD_NAMES = frozenset(f.name for f in fields(RAGConfig) if f.init)
@@ -21,8 +21,7 @@ class SearchResults:
     
     def __post_init__(self):
         """Validate search results after initialization."""
-        lengths = [len(self.indices), len(self.distances), len(self.metadata)]
-        if not all(length == lengths[0] for length in lengths):
+        if not len(self.indices) == len(self.distances) == len(self.metadata):
             raise ValueError("Indices, distances, and metadata must have the same length")
     
     def __len__(self) -> int:
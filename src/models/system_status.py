@@ -2,10 +2,12 @@
 System status and operational result data models.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field, fields
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from enum import Enum
+from ._compat import DATACLASS_SLOTS
+from ._serialization import isoformat
 
 
 class SystemHealth(Enum):
@@ -16,7 +18,7 @@ class SystemHealth(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SystemStatus:
     """
     Current status and health information for the RAG system.
@@ -55,7 +57,7 @@ class SystemStatus:
         """Convert system status to dictionary for serialization."""
         return {
             "health": self.health.value,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": isoformat(self.timestamp),
             "components_status": self.components_status,
             "performance_metrics": self.performance_metrics,
             "error_count": self.error_count,
@@ -64,7 +66,7 @@ class SystemStatus:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class IngestionResults:
     """
     Results from document ingestion operations.
@@ -78,12 +80,22 @@ class IngestionResults:
     total_chunks: int = 0
     total_embeddings: int = 0
     processing_time: float = 0.0
-    errors: List[str] = field(default_factory=list)
+    # Initial error messages; read them back through the ``errors`` property.
+    errors: InitVar[Optional[Iterable[str]]] = None
     processed_files: List[str] = field(default_factory=list)
     failed_files: List[str] = field(default_factory=list)
+    # Raw (file_path or None, message) pairs; formatted only when ``errors``
+    # is read so failure-heavy batches do not build strings nobody reports.
+    # Compared through the formatted ``errors`` in __eq__ instead, so equal
+    # results do not depend on how each error was recorded.
+    _error_entries: List[Tuple[Optional[str], str]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
     
-    def __post_init__(self):
+    def __post_init__(self, errors: Optional[Iterable[str]]):
         """Validate ingestion results after initialization."""
+        if errors:
+            self._error_entries.extend((None, message) for message in errors)
         if self.total_documents < 0:
             raise ValueError("Total documents cannot be negative")
         if self.successful_documents < 0:
@@ -103,7 +115,17 @@ class IngestionResults:
         """Record a failed document processing."""
         self.failed_documents += 1
         self.failed_files.append(file_path)
-        self.errors.append(f"{file_path}: {error_message}")
+        self._error_entries.append((file_path, error_message))
+    
+    def add_error(self, error_message: str) -> None:
+        """Record an error that is not tied to a single document."""
+        self._error_entries.append((None, error_message))
+    
+    def _formatted_errors(self) -> Tuple[str, ...]:
+        return tuple(
+            message if file_path is None else f"{file_path}: {message}"
+            for file_path, message in self._error_entries
+        )
     
     def get_success_rate(self) -> float:
         """Calculate the success rate of document processing."""
@@ -117,7 +139,7 @@ class IngestionResults:
     
     def has_errors(self) -> bool:
         """Check if there were any errors during ingestion."""
-        return len(self.errors) > 0
+        return len(self._error_entries) > 0
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert ingestion results to dictionary for serialization."""
@@ -129,14 +151,42 @@ class IngestionResults:
             "total_embeddings": self.total_embeddings,
             "processing_time": self.processing_time,
             "success_rate": self.get_success_rate(),
-            "errors": self.errors,
+            "errors": list(self.errors),
             "processed_files": self.processed_files,
             "failed_files": self.failed_files
         }
     
+    def __eq__(self, other: object) -> bool:
+        """Compare the dataclass fields and the formatted error messages."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.errors == other.errors and all(
+            getattr(self, f.name) == getattr(other, f.name)
+            for f in fields(self)
+            if f.compare
+        )
+    
+    def __repr__(self) -> str:
+        """Dataclass-style representation that includes the formatted errors."""
+        parts = [f"{f.name}={getattr(self, f.name)!r}" for f in fields(self) if f.repr]
+        parts.append(f"errors={list(self.errors)!r}")
+        return f"{type(self).__qualname__}({', '.join(parts)})"
+    
     def __str__(self) -> str:
         """String representation of ingestion results."""
         return (f"IngestionResults(total={self.total_documents}, "
                 f"successful={self.successful_documents}, "
                 f"failed={self.failed_documents}, "
-                f"chunks={self.total_chunks})")
\ No newline at end of file
+                f"chunks={self.total_chunks})")
+
+
+# ``errors`` is both the InitVar (so ``IngestionResults(errors=[...])`` and the
+# old positional order keep working) and the read-side property. @dataclass
+# takes a field's default from the class attribute of the same name, so a
+# property defined in the class body would become the InitVar's default; it
+# is therefore installed once the class is built. It returns a tuple so
+# ``results.errors.append(...)`` fails loudly; use add_error() instead.
+IngestionResults.errors = property(  # type: ignore[assignment]
+    IngestionResults._formatted_errors,
+    doc="Formatted error messages, prefixed with the file path when known.",
+)
@@ -294,6 +294,14 @@ class ProviderFactory:
     def get_supported_llm_providers(cls) -> List[str]:
         return sorted(cls._llm_registry.keys())
 
+    @classmethod
+    def is_embedding_provider_supported(cls, provider_name: str) -> bool:
+        return isinstance(provider_name, str) and provider_name in cls._embedding_registry
+
+    @classmethod
+    def is_llm_provider_supported(cls, provider_name: str) -> bool:
+        return isinstance(provider_name, str) and provider_name in cls._llm_registry
+
     @classmethod
     def get_embedding_provider_config_schema(cls, provider_name: str) -> Dict[str, Any]:
         registration = cls._get_registration("embedding", provider_name)
@@ -174,7 +174,7 @@ class RAGPipeline:
                     self._record_audit("ingestion_no_chunks", {"reason": "no valid chunks were produced"})
         except Exception as exc:
             handled = self.error_handler.handle_error(exc, {"operation": "ingest_documents"})
-            results.errors.append(handled["message"])
+            results.add_error(handled["message"])
             self._record_system_error(handled["message"])
             self._record_audit("ingestion_failed", handled, level="error")
         finally:
@@ -2,19 +2,69 @@
 Configuration utilities for the RAG Digital Twin system.
 """
 
+import copy
+import glob
+import hashlib
 import os
+import re
 import yaml
 import json
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from src.models.rag_config import RAGConfig
 from src.exceptions import ConfigurationError, ErrorCode
 
+try:
+    # libyaml-backed loader; several times faster than the pure-Python one.
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+try:
+    # orjson parses bytes directly and raises a json.JSONDecodeError subclass.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional dependency
+    _json_loads = json.loads
+
+
+# (environment snapshot, flattened and resolved settings). The snapshot
+# records the variables the placeholders resolved to, so a changed variable
+# forces a reload even when the file itself is untouched. Only plain data is
+# cached; every hit builds a fresh RAGConfig from a deep copy, so callers
+# never share nested provider settings.
+_CacheEntry = Tuple[Tuple[Tuple[str, str], ...], Dict[str, Any]]
+
+# One entry per resolved path, tagged with the (st_mtime_ns, st_size) it was
+# loaded from; an edited file replaces its previous entry.
+_CONFIG_CACHE: Dict[str, Tuple[int, int, _CacheEntry]] = {}
+
+# Second level, keyed by (suffix, BLAKE2b digest of the file bytes): the same
+# template loaded from another path, or rewritten unchanged, parses once.
+# Every edit produces a new digest, so the oldest entries are evicted first
+# once the limit is reached.
+_CONTENT_CACHE: Dict[Tuple[str, bytes], _CacheEntry] = {}
+_CONTENT_CACHE_MAX_ENTRIES = 32
+
+
+def _cached_config(entry: Optional[_CacheEntry]) -> Optional[RAGConfig]:
+    if entry is None:
+        return None
+    env_snapshot, resolved_config = entry
+    if all(os.environ.get(name) == value for name, value in env_snapshot):
+        return RAGConfig.from_dict(copy.deepcopy(resolved_config))
+    return None
+
 
 def load_config(config_path: str) -> RAGConfig:
     """
     Load configuration from a YAML or JSON file.
     
+    Results are memoized on the file's path, modification time and size, and
+    on a hash of its contents, so repeated loads of an unchanged file (or of
+    an identical copy elsewhere) skip re-parsing. Each call still returns a
+    new ``RAGConfig`` with its own nested settings. Call
+    ``load_config.cache_clear()`` to drop the memo.
+    
     Args:
         config_path: Path to configuration file
         
@@ -24,58 +74,88 @@ def load_config(config_path: str) -> RAGConfig:
     Raises:
         ConfigurationError: If configuration cannot be loaded or is invalid
     """
+    config_file = Path(config_path)
+    
     try:
-        config_file = Path(config_path)
-        
-        if not config_file.exists():
-            raise ConfigurationError(
-                f"Configuration file not found: {config_path}",
-                ErrorCode.CONFIG_MISSING_REQUIRED,
-                "config_path"
-            )
-        
-        # Load configuration based on file extension
-        with open(config_file, 'r') as f:
-            if config_file.suffix.lower() in ['.yaml', '.yml']:
-                config_data = yaml.safe_load(f)
-            elif config_file.suffix.lower() == '.json':
-                config_data = json.load(f)
-            else:
-                raise ConfigurationError(
-                    f"Unsupported configuration file format: {config_file.suffix}",
-                    ErrorCode.CONFIG_INVALID,
-                    "file_format"
-                )
-        
-        # Flatten nested configuration structure
-        flattened_config = _flatten_config(config_data)
-        
-        # Substitute environment variables
-        resolved_config = _resolve_environment_variables(flattened_config)
-        
-        # Create RAGConfig instance
-        return RAGConfig.from_dict(resolved_config)
-        
-    except ConfigurationError:
-        raise
-    except yaml.YAMLError as e:
+        stat = config_file.stat()
+    except OSError:
         raise ConfigurationError(
-            f"Invalid YAML configuration: {e}",
+            f"Configuration file not found: {config_path}",
+            ErrorCode.CONFIG_MISSING_REQUIRED,
+            "config_path"
+        )
+    
+    path_key = str(config_file.resolve())
+    cached = _CONFIG_CACHE.get(path_key)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        config = _cached_config(cached[2])
+        if config is not None:
+            return config
+    
+    suffix = config_file.suffix.lower()
+    loader = _FORMAT_LOADERS.get(suffix)
+    if loader is None:
+        raise ConfigurationError(
+            f"Unsupported configuration file format: {config_file.suffix}",
             ErrorCode.CONFIG_INVALID,
-            cause=e
+            "file_format"
         )
-    except json.JSONDecodeError as e:
+    
+    try:
+        raw = config_file.read_bytes()
+    except OSError as e:
         raise ConfigurationError(
-            f"Invalid JSON configuration: {e}",
+            f"Failed to load configuration: {e}",
             ErrorCode.CONFIG_INVALID,
             cause=e
         )
-    except Exception as e:
+    
+    content_key = (suffix, hashlib.blake2b(raw, digest_size=16).digest())
+    config = _cached_config(_CONTENT_CACHE.get(content_key))
+    if config is not None:
+        _CONFIG_CACHE[path_key] = (stat.st_mtime_ns, stat.st_size, _CONTENT_CACHE[content_key])
+        return config
+    
+    # Load configuration based on file extension
+    config_data = loader(config_file, raw)
+    if not isinstance(config_data, dict):
+        raise ConfigurationError(
+            f"Failed to load configuration: expected a mapping at the top level of {config_path}",
+            ErrorCode.CONFIG_INVALID
+        )
+    
+    # Flatten nested configuration structure
+    flattened_config = _flatten_config(config_data)
+    
+    # Substitute environment variables
+    used_env: Dict[str, str] = {}
+    resolved_config = _resolve_environment_variables(flattened_config, used_env)
+    
+    # Create RAGConfig instance
+    try:
+        config = RAGConfig.from_dict(resolved_config)
+    except (TypeError, ValueError) as e:
         raise ConfigurationError(
             f"Failed to load configuration: {e}",
             ErrorCode.CONFIG_INVALID,
             cause=e
         )
+    
+    # The new config holds the resolved nested dicts, so cache a copy.
+    entry = (tuple(used_env.items()), copy.deepcopy(resolved_config))
+    _CONFIG_CACHE[path_key] = (stat.st_mtime_ns, stat.st_size, entry)
+    if len(_CONTENT_CACHE) >= _CONTENT_CACHE_MAX_ENTRIES:
+        del _CONTENT_CACHE[next(iter(_CONTENT_CACHE))]
+    _CONTENT_CACHE[content_key] = entry
+    return config
+
+
+def _clear_config_cache() -> None:
+    _CONFIG_CACHE.clear()
+    _CONTENT_CACHE.clear()
+
+
+load_config.cache_clear = _clear_config_cache  # type: ignore[attr-defined]
 
 
 def validate_config(config: RAGConfig) -> bool:
@@ -101,10 +181,41 @@ def validate_config(config: RAGConfig) -> bool:
         )
 
 
+# (section, nested key, RAGConfig field) for the sectioned config layout.
+_NESTED_MAP = (
+    ('embedding', 'provider', 'embedding_provider'),
+    ('embedding', 'model', 'embedding_model'),
+    ('embedding', 'provider_config', 'embedding_provider_config'),
+    ('embedding', 'fallbacks', 'embedding_fallbacks'),
+    ('llm', 'provider', 'llm_provider'),
+    ('llm', 'model', 'llm_model'),
+    ('llm', 'provider_config', 'llm_provider_config'),
+    ('llm', 'fallbacks', 'llm_fallbacks'),
+    ('document_processing', 'chunk_size', 'chunk_size'),
+    ('document_processing', 'chunk_overlap', 'chunk_overlap'),
+    ('retrieval', 'top_k_results', 'top_k_results'),
+    ('retrieval', 'similarity_threshold', 'similarity_threshold'),
+    ('retrieval', 'max_context_length', 'max_context_length'),
+    ('response', 'max_tokens', 'max_response_tokens'),
+    ('response', 'temperature', 'temperature'),
+    ('system', 'batch_size', 'batch_size'),
+    ('system', 'max_retries', 'max_retries'),
+    ('system', 'timeout_seconds', 'timeout_seconds'),
+    ('paths', 'data_directory', 'data_directory'),
+    ('paths', 'embeddings_directory', 'embeddings_directory'),
+    ('paths', 'logs_directory', 'logs_directory'),
+)
+
+# Flat top-level keys accepted for backward compatibility.
+_DIRECT_KEYS = frozenset(target for _section, _key, target in _NESTED_MAP)
+
+
 def _flatten_config(config_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Flatten nested configuration structure to match RAGConfig fields.
     
+    Direct top-level keys take precedence over their sectioned equivalents.
+    
     Args:
         config_data: Nested configuration dictionary
         
@@ -113,93 +224,229 @@ def _flatten_config(config_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     flattened = {}
     
-    # Map nested structure to flat structure
-    mapping = {
-        ('embedding', 'provider'): 'embedding_provider',
-        ('embedding', 'model'): 'embedding_model',
-        ('embedding', 'provider_config'): 'embedding_provider_config',
-        ('embedding', 'fallbacks'): 'embedding_fallbacks',
-        ('llm', 'provider'): 'llm_provider',
-        ('llm', 'model'): 'llm_model',
-        ('llm', 'provider_config'): 'llm_provider_config',
-        ('llm', 'fallbacks'): 'llm_fallbacks',
-        ('document_processing', 'chunk_size'): 'chunk_size',
-        ('document_processing', 'chunk_overlap'): 'chunk_overlap',
-        ('retrieval', 'top_k_results'): 'top_k_results',
-        ('retrieval', 'similarity_threshold'): 'similarity_threshold',
-        ('retrieval', 'max_context_length'): 'max_context_length',
-        ('response', 'max_tokens'): 'max_response_tokens',
-        ('response', 'temperature'): 'temperature',
-        ('system', 'batch_size'): 'batch_size',
-        ('system', 'max_retries'): 'max_retries',
-        ('system', 'timeout_seconds'): 'timeout_seconds',
-        ('paths', 'data_directory'): 'data_directory',
-        ('paths', 'embeddings_directory'): 'embeddings_directory',
-        ('paths', 'logs_directory'): 'logs_directory',
-    }
-    
-    # Apply mappings
-    for (section, key), target_key in mapping.items():
-        if section in config_data and key in config_data[section]:
-            flattened[target_key] = config_data[section][key]
-    
-    # Handle direct mappings (for backward compatibility)
-    direct_keys = [
-        'embedding_provider', 'embedding_model', 'embedding_provider_config', 'embedding_fallbacks',
-        'llm_provider', 'llm_model', 'llm_provider_config', 'llm_fallbacks',
-        'chunk_size', 'chunk_overlap', 'top_k_results', 'similarity_threshold',
-        'max_context_length', 'max_response_tokens', 'temperature',
-        'batch_size', 'max_retries', 'timeout_seconds',
-        'data_directory', 'embeddings_directory', 'logs_directory'
-    ]
+    for section, key, target in _NESTED_MAP:
+        sub = config_data.get(section)
+        if isinstance(sub, dict) and key in sub:
+            flattened[target] = sub[key]
     
-    for key in direct_keys:
-        if key in config_data:
-            flattened[key] = config_data[key]
+    for key in _DIRECT_KEYS & config_data.keys():
+        flattened[key] = config_data[key]
     
     return flattened
 
 
-def _resolve_environment_variables(config_data: Any) -> Any:
+# The whole value must be a single placeholder; \Z (unlike $) does not
+# match before a trailing newline.
+_ENV_PLACEHOLDER_RE = re.compile(r'\A\$\{([^}]+)\}\Z')
+
+
+def _resolve_environment_variables(
+    config_data: Any,
+    used_env: Optional[Dict[str, str]] = None,
+) -> Any:
     """
     Resolve environment variable references in configuration values.
     
+    Each variable is read from ``os.environ`` at most once per call, however
+    many values reference it.
+    
     Args:
         config_data: Configuration dictionary
+        used_env: Optional mapping that collects each variable name and the
+            value it resolved to
         
     Returns:
         Configuration with resolved environment variables
     """
+    if used_env is None:
+        used_env = {}
+
     if isinstance(config_data, dict):
-        return {key: _resolve_environment_variables(value) for key, value in config_data.items()}
+        return {
+            key: _resolve_environment_variables(value, used_env)
+            for key, value in config_data.items()
+        }
 
     if isinstance(config_data, list):
-        return [_resolve_environment_variables(value) for value in config_data]
+        return [_resolve_environment_variables(value, used_env) for value in config_data]
 
-    if isinstance(config_data, str) and config_data.startswith('${') and config_data.endswith('}'):
-        env_var = config_data[2:-1]
-        resolved_value = os.getenv(env_var)
+    if isinstance(config_data, str):
+        match = _ENV_PLACEHOLDER_RE.match(config_data)
+        if match is None:
+            return config_data
 
+        env_var = match.group(1)
+        resolved_value = used_env.get(env_var)
         if resolved_value is None:
-            raise ConfigurationError(
-                f"Environment variable not found: {env_var}",
-                ErrorCode.CONFIG_MISSING_REQUIRED,
-                env_var
-            )
+            resolved_value = os.environ.get(env_var)
+
+            if resolved_value is None:
+                raise ConfigurationError(
+                    f"Environment variable not found: {env_var}",
+                    ErrorCode.CONFIG_MISSING_REQUIRED,
+                    env_var
+                )
+
+            used_env[env_var] = resolved_value
 
         return resolved_value
 
     return config_data
 
 
+# First line of a YAML config that opts into the JSON shadow cache. The
+# digest covers every byte after this line, so an edited file whose header
+# was not restamped simply bypasses the cache.
+_CONTENT_VERSION_RE = re.compile(rb"\A#\s*content-version:\s*([0-9a-f]{32})\s*\r?\n")
+
+
+def _content_digest(body: bytes) -> str:
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _shadow_cache_path(config_file: Path, digest: str) -> Path:
+    return config_file.with_name(f"{config_file.name}.{digest}.cache")
+
+
+def _remove_stale_shadow_caches(cache_path: Path) -> None:
+    """Delete shadow caches of the same config written for other digests."""
+    config_name = cache_path.name.rsplit(".", 2)[0]
+    pattern = os.path.join(
+        glob.escape(str(cache_path.parent)),
+        f"{glob.escape(config_name)}.{'[0-9a-f]' * 32}.cache",
+    )
+    for stale_path in glob.glob(pattern):
+        if os.path.basename(stale_path) != cache_path.name:
+            try:
+                os.remove(stale_path)
+            except OSError:
+                pass
+
+
+def _load_yaml_with_shadow_cache(config_file: Path, raw: bytes) -> Any:
+    """
+    Parse a YAML config, reusing a JSON shadow copy when the header allows it.
+    
+    Files starting with ``# content-version: <digest>`` (see
+    :func:`write_content_version`) are parsed once and the result is written
+    next to them as ``<name>.<digest>.cache``; later loads read that JSON
+    instead of running the YAML parser. Files without a valid header are
+    parsed directly and never cached.
+    """
+    header = _CONTENT_VERSION_RE.match(raw)
+    digest: Optional[str] = None
+    if header and _content_digest(raw[header.end():]) == header.group(1).decode("ascii"):
+        digest = header.group(1).decode("ascii")
+
+    if digest is not None:
+        cache_path = _shadow_cache_path(config_file, digest)
+        try:
+            return _json_loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            pass
+
+    # Hand libyaml the undecoded bytes; it detects the encoding and decodes
+    # in C, so the file is never decoded to str on the Python side.
+    config_data = yaml.load(raw, Loader=_SafeLoader)
+
+    if digest is not None:
+        _write_shadow_cache(cache_path, config_data)
+
+    return config_data
+
+
+def _write_shadow_cache(cache_path: Path, config_data: Any) -> None:
+    try:
+        serialized = json.dumps(config_data)
+    except (TypeError, ValueError):
+        return
+    # JSON would silently stringify non-string keys or turn tuples into
+    # lists; only cache data that survives the round trip unchanged.
+    if json.loads(serialized) != config_data:
+        return
+
+    temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        temp_path.write_text(serialized, encoding="utf-8")
+        os.replace(temp_path, cache_path)
+    except OSError:
+        # A read-only config directory just means no shadow cache.
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        return
+
+    # Earlier restamps left caches under their old digests; only the one
+    # matching the current header can ever be read again.
+    _remove_stale_shadow_caches(cache_path)
+
+
+def _load_yaml(config_file: Path, raw: bytes) -> Any:
+    try:
+        return _load_yaml_with_shadow_cache(config_file, raw)
+    except yaml.YAMLError as e:
+        raise ConfigurationError(
+            f"Invalid YAML configuration: {e}",
+            ErrorCode.CONFIG_INVALID,
+            cause=e
+        )
+
+
+def _load_json(config_file: Path, raw: bytes) -> Any:
+    try:
+        return _json_loads(raw)
+    except ValueError as e:
+        # json.JSONDecodeError and orjson.JSONDecodeError are both ValueErrors;
+        # so is the UnicodeDecodeError raised for undecodable bytes.
+        raise ConfigurationError(
+            f"Invalid JSON configuration: {e}",
+            ErrorCode.CONFIG_INVALID,
+            cause=e
+        )
+
+
+# Parser per file suffix; each raises ConfigurationError for malformed input.
+_FORMAT_LOADERS = {
+    '.yaml': _load_yaml,
+    '.yml': _load_yaml,
+    '.json': _load_json,
+}
+
+
+def write_content_version(config_path: str) -> str:
+    """
+    Stamp a YAML configuration file with a ``# content-version`` header.
+    
+    Any existing header is replaced. Re-run this after editing the file so
+    :func:`load_config` can keep using the JSON shadow cache.
+    
+    Args:
+        config_path: Path to the YAML configuration file
+        
+    Returns:
+        The content digest written to the header
+    """
+    config_file = Path(config_path)
+    raw = config_file.read_bytes()
+    header = _CONTENT_VERSION_RE.match(raw)
+    body = raw[header.end():] if header else raw
+    digest = _content_digest(body)
+    config_file.write_bytes(f"# content-version: {digest}\n".encode("ascii") + body)
+    return digest
+
+
 def get_default_config_path() -> str:
     """
     Get the default configuration file path.
     
+    JSON is the preferred format because it loads with the C ``json``
+    parser; YAML files are still accepted by :func:`load_config`.
+    
     Returns:
         Path to default configuration file
     """
-    return "config/rag_config.yaml"
+    return "config/rag_config.json"
 
 
 def create_default_config(output_path: str) -> None:
@@ -280,3 +527,6 @@ def create_default_config(output_path: str) -> None:
                 ErrorCode.CONFIG_INVALID,
                 "file_format"
             )
+
+    if config_file.suffix.lower() in [".yaml", ".yml"]:
+        write_content_version(str(config_file))
@@ -2,10 +2,13 @@
 File utilities for the RAG Digital Twin system.
 """
 
+import fnmatch
 import os
 import shutil
+import stat
+import time
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 import mimetypes
 
 
@@ -37,7 +40,7 @@ def get_file_size(file_path: str) -> int:
     Raises:
         FileNotFoundError: If file doesn't exist
     """
-    return Path(file_path).stat().st_size
+    return os.stat(file_path).st_size
 
 
 def is_valid_file(file_path: str, max_size_mb: Optional[int] = None) -> Tuple[bool, str]:
@@ -51,19 +54,19 @@ def is_valid_file(file_path: str, max_size_mb: Optional[int] = None) -> Tuple[bo
     Returns:
         Tuple of (is_valid, error_message)
     """
-    path = Path(file_path)
-    
-    # Check if file exists
-    if not path.exists():
+    # One stat answers existence, file type and size
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
         return False, f"File does not exist: {file_path}"
     
     # Check if it's a file (not directory)
-    if not path.is_file():
+    if not stat.S_ISREG(file_stat.st_mode):
         return False, f"Path is not a file: {file_path}"
     
     # Check file size
     if max_size_mb:
-        file_size_mb = get_file_size(file_path) / (1024 * 1024)
+        file_size_mb = file_stat.st_size / (1024 * 1024)
         if file_size_mb > max_size_mb:
             return False, f"File too large: {file_size_mb:.1f}MB > {max_size_mb}MB"
     
@@ -74,6 +77,15 @@ def is_valid_file(file_path: str, max_size_mb: Optional[int] = None) -> Tuple[bo
     return True, ""
 
 
+# Extension -> file type for every format the document processor can read.
+_FILE_TYPES = {
+    '.pdf': 'pdf',
+    '.txt': 'txt',
+}
+
+_SUPPORTED_EXTENSIONS = frozenset(_FILE_TYPES)
+
+
 def get_supported_file_types() -> List[str]:
     """
     Get list of supported file types.
@@ -81,7 +93,7 @@ def get_supported_file_types() -> List[str]:
     Returns:
         List of supported file extensions
     """
-    return ['.pdf', '.txt']
+    return list(_FILE_TYPES)
 
 
 def is_supported_file_type(file_path: str) -> bool:
@@ -94,8 +106,7 @@ def is_supported_file_type(file_path: str) -> bool:
     Returns:
         True if file type is supported
     """
-    extension = Path(file_path).suffix.lower()
-    return extension in get_supported_file_types()
+    return os.path.splitext(file_path)[1].lower() in _SUPPORTED_EXTENSIONS
 
 
 def get_file_type(file_path: str) -> str:
@@ -108,14 +119,11 @@ def get_file_type(file_path: str) -> str:
     Returns:
         File type string (pdf, txt, md, unknown)
     """
-    extension = Path(file_path).suffix.lower()
-    
-    type_mapping = {
-        '.pdf': 'pdf',
-        '.txt': 'txt',
-    }
-    
-    return type_mapping.get(extension, 'unknown')
+    return _FILE_TYPES.get(os.path.splitext(file_path)[1].lower(), 'unknown')
+
+
+# Characters invalid in filenames on most filesystems, mapped to '_'.
+_INVALID_FILENAME_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
 
 
 def clean_filename(filename: str) -> str:
@@ -128,15 +136,9 @@ def clean_filename(filename: str) -> str:
     Returns:
         Cleaned filename
     """
-    # Remove invalid characters for most filesystems
-    invalid_chars = '<>:"/\\|?*'
-    cleaned = filename
-    
-    for char in invalid_chars:
-        cleaned = cleaned.replace(char, '_')
-    
-    # Remove leading/trailing whitespace and dots
-    cleaned = cleaned.strip(' .')
+    # Replace characters invalid on most filesystems, then trim
+    # leading/trailing whitespace and dots
+    cleaned = filename.translate(_INVALID_FILENAME_CHARS).strip(' .')
     
     # Ensure filename is not empty
     if not cleaned:
@@ -145,13 +147,21 @@ def clean_filename(filename: str) -> str:
     return cleaned
 
 
-def backup_file(file_path: str, backup_dir: Optional[str] = None) -> str:
+def backup_file(
+    file_path: str,
+    backup_dir: Optional[str] = None,
+    hardlink: bool = False,
+) -> str:
     """
     Create a backup copy of a file.
     
     Args:
         file_path: Path to file to backup
         backup_dir: Directory for backup (optional)
+        hardlink: Hard-link the backup instead of copying when source and
+            backup share a filesystem. A hard link shares the original's
+            data, so only use this when the source is replaced (e.g. via
+            ``os.replace``) rather than rewritten in place.
         
     Returns:
         Path to backup file
@@ -165,11 +175,18 @@ def backup_file(file_path: str, backup_dir: Optional[str] = None) -> str:
         backup_path = source_path.parent
     
     # Create backup filename with timestamp
-    from datetime import datetime
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     backup_filename = f"{source_path.stem}_{timestamp}{source_path.suffix}"
     backup_file_path = backup_path / backup_filename
     
+    if hardlink:
+        try:
+            os.link(source_path, backup_file_path)
+            return str(backup_file_path)
+        except OSError:
+            # Cross-device, unsupported filesystem, or target exists
+            pass
+    
     # Copy file
     shutil.copy2(source_path, backup_file_path)
     
@@ -188,17 +205,50 @@ def find_files(directory: str, pattern: str = "*", recursive: bool = True) -> Li
     Returns:
         List of matching file paths
     """
-    path = Path(directory)
-    
-    if not path.exists():
+    if not os.path.isdir(directory):
         return []
     
-    if recursive:
-        files = path.rglob(pattern)
-    else:
-        files = path.glob(pattern)
+    if os.sep in pattern or (os.altsep and os.altsep in pattern):
+        # Multi-component patterns need pathlib's segment matching
+        path = Path(directory)
+        files = path.rglob(pattern) if recursive else path.glob(pattern)
+        return [str(f) for f in files if f.is_file()]
+    
+    if not recursive:
+        with os.scandir(directory) as entries:
+            return [
+                entry.path
+                for entry in entries
+                if entry.is_file() and fnmatch.fnmatch(entry.name, pattern)
+            ]
+    
+    # DirEntry.is_file() drops broken symlinks, FIFOs and other non-files
+    return [
+        entry.path
+        for entry in _iter_files_scandir(directory)
+        if pattern == "*" or fnmatch.fnmatch(entry.name, pattern)
+    ]
+
+
+def _iter_files_scandir(directory: str) -> Iterator[os.DirEntry]:
+    """
+    Yield a DirEntry for every file below a directory.
     
-    return [str(f) for f in files if f.is_file()]
+    Symlinked directories are not descended into. Directories that cannot be
+    listed are skipped.
+    """
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            continue
 
 
 def get_directory_size(directory: str) -> int:
@@ -213,16 +263,19 @@ def get_directory_size(directory: str) -> int:
     """
     total_size = 0
     
-    for file_path in find_files(directory):
+    for entry in _iter_files_scandir(directory):
         try:
-            total_size += get_file_size(file_path)
-        except (OSError, FileNotFoundError):
+            total_size += entry.stat().st_size
+        except OSError:
             # Skip files that can't be accessed
             continue
     
     return total_size
 
 
+_SIZE_NAMES = ("B", "KB", "MB", "GB", "TB")
+
+
 def format_file_size(size_bytes: int) -> str:
     """
     Format file size in human-readable format.
@@ -236,11 +289,10 @@ def format_file_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0 B"
     
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
+    if size_bytes < 1024:
+        return f"{size_bytes:.1f} {_SIZE_NAMES[0]}"
     
-    return f"{size_bytes:.1f} {size_names[i]}"
+    # Unit index is floor(log1024(size)), read straight off the bit length;
+    # int() keeps float sizes working and never changes the unit chosen.
+    i = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_NAMES) - 1)
+    return f"{size_bytes / (1 << (10 * i)):.1f} {_SIZE_NAMES[i]}"
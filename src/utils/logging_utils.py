@@ -33,9 +33,13 @@ def setup_logging(
     if log_format is None:
         log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     
+    # Resolve the level and build the formatter once for every handler
+    level = getattr(logging, log_level.upper())
+    formatter = logging.Formatter(log_format)
+    
     # Configure root logger
     logger = logging.getLogger("rag_digital_twin")
-    logger.setLevel(getattr(logging, log_level.upper()))
+    logger.setLevel(level)
     
     # Clear existing handlers
     for handler in logger.handlers[:]:
@@ -44,9 +48,8 @@ def setup_logging(
     
     # Console handler
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, log_level.upper()))
-    console_formatter = logging.Formatter(log_format)
-    console_handler.setFormatter(console_formatter)
+    console_handler.setLevel(level)
+    console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
     
     # File handler (if log_file is specified)
@@ -61,9 +64,8 @@ def setup_logging(
             maxBytes=max_bytes,
             backupCount=backup_count
         )
-        file_handler.setLevel(getattr(logging, log_level.upper()))
-        file_formatter = logging.Formatter(log_format)
-        file_handler.setFormatter(file_formatter)
+        file_handler.setLevel(level)
+        file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
     
     return logger
@@ -85,25 +87,42 @@ def get_logger(name: str) -> logging.Logger:
 class LoggerMixin:
     """
     Mixin class to add logging capabilities to other classes.
+    
+    Keyword arguments to the ``log_*`` helpers are attached to the record as
+    ``extra`` fields; calls below the logger's effective level return early.
     """
     
     @property
     def logger(self) -> logging.Logger:
-        """Get logger for this class."""
-        return get_logger(self.__class__.__name__)
+        """Get logger for this class, cached on the class after first use."""
+        cls = type(self)
+        # Read the class's own __dict__ so subclasses never inherit a parent's logger
+        logger = cls.__dict__.get("_logger")
+        if logger is None:
+            logger = get_logger(cls.__name__)
+            cls._logger = logger
+        return logger
     
     def log_info(self, message: str, **kwargs) -> None:
         """Log an info message."""
-        self.logger.info(message, extra=kwargs)
+        logger = self.logger
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(message, extra=kwargs or None)
     
     def log_warning(self, message: str, **kwargs) -> None:
         """Log a warning message."""
-        self.logger.warning(message, extra=kwargs)
+        logger = self.logger
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(message, extra=kwargs or None)
     
     def log_error(self, message: str, **kwargs) -> None:
         """Log an error message."""
-        self.logger.error(message, extra=kwargs)
+        logger = self.logger
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(message, extra=kwargs or None)
     
     def log_debug(self, message: str, **kwargs) -> None:
         """Log a debug message."""
-        self.logger.debug(message, extra=kwargs)
+        logger = self.logger
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(message, extra=kwargs or None)
@@ -2,18 +2,42 @@
 Pytest configuration and shared fixtures for the RAG Digital Twin test suite.
 """
 
+import logging
+import os
+import re
 import pytest
 import tempfile
 import shutil
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, List
+from hypothesis import HealthCheck, settings
 
 from src.models.document_chunk import DocumentChunk
 from src.models.embedding_metadata import EmbeddingMetadata
 from src.models.rag_config import RAGConfig
 from src.models.search_results import SearchResults, QueryResults, RetrievedContext, GeneratedResponse
 from src.models.system_status import SystemStatus, IngestionResults, SystemHealth
+from src.exceptions import ErrorHandler
+
+
+# Hypothesis profiles, selected with HYPOTHESIS_PROFILE. "fast" (the default)
+# keeps local runs short; "ci" restores the full example budget. Both are
+# derandomized so every run explores the same examples. Loaded here, before
+# test modules import, so module-level @settings objects inherit the profile.
+settings.register_profile(
+    "fast",
+    max_examples=25,
+    derandomize=True,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+settings.register_profile("ci", max_examples=100, derandomize=True)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "fast"))
+
+
+# Session-scoped fixtures are built once and shared by every test that uses
+# them; tests must treat them as read-only. Function-scoped fixtures remain
+# for anything a test is expected to mutate.
 
 
 @pytest.fixture
@@ -25,6 +49,33 @@ def temp_directory():
 
 
 @pytest.fixture
+def isolated_logging(temp_directory):
+    """
+    Yield the package logger and detach every handler a test adds to it.
+    
+    Handlers are closed on teardown even when the test fails, so log files
+    are never left open. Depending on ``temp_directory`` makes pytest tear
+    this fixture down first, so log files written there are closed before
+    the directory is removed (open files cannot be deleted on Windows).
+    Only this logger is touched; logging.shutdown() would also close
+    pytest's own capture handlers.
+    """
+    logger = logging.getLogger("rag_digital_twin")
+    original_level = logger.level
+    yield logger
+    for handler in list(logger.handlers):
+        handler.close()
+        logger.removeHandler(handler)
+    logger.setLevel(original_level)
+
+
+@pytest.fixture(scope="session")
+def shared_tmp_root(tmp_path_factory):
+    """Session-wide directory for read-only file fixtures."""
+    return tmp_path_factory.mktemp("shared")
+
+
+@pytest.fixture(scope="session")
 def sample_document_chunk():
     """Create a sample DocumentChunk for testing."""
     return DocumentChunk(
@@ -35,7 +86,7 @@ def sample_document_chunk():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_document_chunks():
     """Create multiple sample DocumentChunks for testing."""
     return [
@@ -60,7 +111,7 @@ def sample_document_chunks():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_embedding_metadata():
     """Create sample EmbeddingMetadata for testing."""
     return EmbeddingMetadata(
@@ -71,7 +122,7 @@ def sample_embedding_metadata():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_rag_config():
     """Create a sample RAGConfig for testing."""
     return RAGConfig(
@@ -86,7 +137,7 @@ def sample_rag_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_search_results():
     """Create sample SearchResults for testing."""
     return SearchResults(
@@ -122,7 +173,7 @@ def sample_retrieved_context(sample_document_chunks):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_generated_response():
     """Create sample GeneratedResponse for testing."""
     return GeneratedResponse(
@@ -136,7 +187,7 @@ def sample_generated_response():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_system_status():
     """Create sample SystemStatus for testing."""
     status = SystemStatus(
@@ -151,7 +202,7 @@ def sample_system_status():
     return status
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_ingestion_results():
     """Create sample IngestionResults for testing."""
     results = IngestionResults(
@@ -166,14 +217,14 @@ def sample_ingestion_results():
     return results
 
 
-@pytest.fixture
-def sample_text_files(temp_directory):
+@pytest.fixture(scope="session")
+def sample_text_files(shared_tmp_root):
     """Create sample text files for testing document processing."""
     files = []
     
     # Create sample text files
     for i in range(3):
-        file_path = Path(temp_directory) / f"sample_{i}.txt"
+        file_path = shared_tmp_root / f"sample_{i}.txt"
         content = f"This is sample document {i}. " * 50  # Create substantial content
         file_path.write_text(content)
         files.append(str(file_path))
@@ -181,8 +232,37 @@ def sample_text_files(temp_directory):
     return files
 
 
-# Property-based testing configuration
+@pytest.fixture(scope="session")
+def requirements_packages():
+    """Lower-cased package names declared in requirements.txt, parsed once."""
+    requirements_file = Path(__file__).resolve().parents[1] / "requirements.txt"
+    packages = set()
+    for line in requirements_file.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            packages.add(re.split(r"[\s\[<>=!~;]", line, maxsplit=1)[0].lower())
+    return frozenset(packages)
+
+
+@pytest.fixture(scope="session")
+def _session_error_handler():
+    return ErrorHandler()
+
+
 @pytest.fixture
+def shared_error_handler(_session_error_handler):
+    """
+    Provide one ErrorHandler for the whole session, with counts reset after each test.
+    
+    For tests that only inspect handle_error() responses; tests asserting on
+    statistics from a known starting state should build their own handler.
+    """
+    yield _session_error_handler
+    _session_error_handler.reset_error_counts()
+
+
+# Property-based testing configuration
+@pytest.fixture(scope="session")
 def hypothesis_settings():
     """Configure hypothesis settings for property-based tests."""
     from hypothesis import settings
@@ -226,7 +306,7 @@ class TestDataGenerators:
         return st.integers(min_value=50, max_value=2048)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_generators():
     """Provide test data generators for property-based testing."""
     return TestDataGenerators
\ No newline at end of file
@@ -5,12 +5,25 @@ Tests for CLI entry points, config templates, and interactive session handling.
 from __future__ import annotations
 
 import json
+import logging
 from pathlib import Path
+import shutil
+import subprocess
+import sys
 
+import pytest
 import yaml
 
 from src.cli import ingest_command, query_command
-from src.utils.config_utils import create_default_config, load_config
+from src.exceptions import ConfigurationError, ErrorCode
+from src.utils import config_utils
+from src.utils.config_utils import (
+    create_default_config,
+    get_default_config_path,
+    load_config,
+    write_content_version,
+)
+from src.utils.logging_utils import setup_logging
 
 
 def _write_cli_config(temp_directory: str) -> Path:
@@ -62,6 +75,38 @@ def _write_cli_config(temp_directory: str) -> Path:
     return config_path
 
 
+class TestCLIStartup:
+    def test_cli_import_defers_pipeline_dependencies(self):
+        probe = (
+            "import sys, src.cli; "
+            "print(','.join(m for m in ('numpy', 'faiss', 'src.rag_pipeline') if m in sys.modules))"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", probe],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parents[1],
+        )
+
+        assert completed.stdout.strip() == ""
+
+
+class TestCLILogging:
+    def test_setup_logging_writes_formatted_records_to_file(self, isolated_logging, temp_directory):
+        log_file = Path(temp_directory) / "logs" / "cli.log"
+
+        logger = setup_logging(log_level="warning", log_file=str(log_file), log_format="%(levelname)s|%(message)s")
+        logger.info("suppressed")
+        logger.warning("recorded")
+        for handler in logger.handlers:
+            handler.flush()
+
+        assert logger is isolated_logging
+        assert [handler.level for handler in logger.handlers] == [logging.WARNING, logging.WARNING]
+        assert log_file.read_text(encoding="utf-8") == "WARNING|recorded\n"
+
+
 class TestCLIIngestion:
     def test_ingest_command_processes_directory_and_persists_store(self, temp_directory, capsys):
         config_path = _write_cli_config(temp_directory)
@@ -188,6 +233,28 @@ class TestConfigTemplates:
         assert generated["embedding"]["provider_config"]["api_key"] == "${OPENAI_API_KEY}"
         assert generated["llm"]["fallbacks"][0]["provider"] == "huggingface"
 
+    def test_default_config_is_json_and_matches_yaml_template(self, temp_directory, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        repo_root = Path(__file__).resolve().parents[1]
+        default_path = repo_root / get_default_config_path()
+        assert default_path.suffix == ".json"
+
+        # Load copies: the stamped YAML template writes a shadow cache next
+        # to whatever file is loaded, which must not land in the source tree.
+        json_copy = Path(shutil.copy(default_path, temp_directory))
+        yaml_copy = Path(shutil.copy(repo_root / "config" / "rag_config.yaml", temp_directory))
+
+        assert load_config(str(json_copy)) == load_config(str(yaml_copy))
+
+    def test_load_config_reports_invalid_json(self, temp_directory):
+        config_path = Path(temp_directory) / "broken.json"
+        config_path.write_text('{"document_processing": {"chunk_size": }', encoding="utf-8")
+
+        with pytest.raises(ConfigurationError, match="Invalid JSON configuration") as exc_info:
+            load_config(str(config_path))
+
+        assert exc_info.value.error_code == ErrorCode.CONFIG_INVALID
+
     def test_load_config_resolves_nested_environment_variables(self, temp_directory, monkeypatch):
         config_path = Path(temp_directory) / "nested_env.yaml"
         config_path.write_text(
@@ -245,3 +312,128 @@ class TestConfigTemplates:
 
         assert config.embedding_provider_config["api_key"] == "test-key"
         assert config.llm_provider_config["api_key"] == "test-key"
+
+    def test_load_config_uses_json_shadow_cache_for_stamped_yaml(self, temp_directory):
+        config_path = _write_cli_config(temp_directory)
+        digest = write_content_version(str(config_path))
+        cache_path = config_path.with_name(f"{config_path.name}.{digest}.cache")
+
+        assert load_config(str(config_path)).chunk_size == 120
+        assert cache_path.exists()
+
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        cached["document_processing"]["chunk_size"] = 150
+        cache_path.write_text(json.dumps(cached), encoding="utf-8")
+        load_config.cache_clear()
+        assert load_config(str(config_path)).chunk_size == 150
+
+        edited = config_path.read_text(encoding="utf-8").replace("chunk_size: 120", "chunk_size: 130")
+        config_path.write_text(edited, encoding="utf-8")
+        load_config.cache_clear()
+        assert load_config(str(config_path)).chunk_size == 130
+
+        new_digest = write_content_version(str(config_path))
+        assert load_config(str(config_path)).chunk_size == 130
+        assert sorted(path.name for path in config_path.parent.glob("*.cache")) == [
+            f"{config_path.name}.{new_digest}.cache"
+        ]
+
+    def test_load_config_memoizes_unchanged_files(self, temp_directory, monkeypatch):
+        config_path = _write_cli_config(temp_directory)
+        text = config_path.read_text(encoding="utf-8")
+        config_path.write_text(
+            text.replace("mock_responses: true", "api_key: ${RAG_TEST_LLM_KEY}"),
+            encoding="utf-8",
+        )
+        monkeypatch.setenv("RAG_TEST_LLM_KEY", "first")
+
+        first = load_config(str(config_path))
+        assert load_config(str(config_path)) == first
+
+        monkeypatch.setenv("RAG_TEST_LLM_KEY", "second")
+        reloaded = load_config(str(config_path))
+        assert reloaded.llm_provider_config["api_key"] == "second"
+
+        config_path.write_text(text.replace("chunk_size: 120", "chunk_size: 96"), encoding="utf-8")
+        assert load_config(str(config_path)).chunk_size == 96
+
+    def test_load_config_cache_hits_do_not_share_nested_settings(self, temp_directory):
+        config_path = _write_cli_config(temp_directory)
+
+        first = load_config(str(config_path))
+        first.llm_provider_config["api_key"] = "hijacked"
+        first.embedding_fallbacks.append({"provider": "unvalidated"})
+        second = load_config(str(config_path))
+
+        assert second is not first
+        assert "api_key" not in second.llm_provider_config
+        assert second.embedding_fallbacks == []
+
+    def test_load_config_keeps_one_cache_entry_per_path(self, temp_directory):
+        config_path = _write_cli_config(temp_directory)
+        text = config_path.read_text(encoding="utf-8")
+        entries_before = len(config_utils._CONFIG_CACHE)
+
+        for chunk_size in (96, 960, 1200):
+            config_path.write_text(text.replace("chunk_size: 120", f"chunk_size: {chunk_size}"), encoding="utf-8")
+            assert load_config(str(config_path)).chunk_size == chunk_size
+
+        assert len(config_utils._CONFIG_CACHE) == entries_before + 1
+
+    def test_load_config_shares_result_for_identical_content(self, temp_directory):
+        config_path = _write_cli_config(temp_directory)
+        copy_path = Path(temp_directory) / "copy" / config_path.name
+        copy_path.parent.mkdir()
+        copy_path.write_bytes(config_path.read_bytes())
+
+        assert load_config(str(copy_path)) == load_config(str(config_path))
+
+    def test_load_config_identical_files_do_not_share_nested_settings(self, temp_directory):
+        config_path = _write_cli_config(temp_directory)
+        copy_path = Path(temp_directory) / "copy" / config_path.name
+        copy_path.parent.mkdir()
+        copy_path.write_bytes(config_path.read_bytes())
+
+        load_config(str(config_path)).llm_provider_config["api_key"] = "hijacked"
+
+        assert "api_key" not in load_config(str(copy_path)).llm_provider_config
+
+    def test_load_config_bounds_content_cache(self, temp_directory, monkeypatch):
+        monkeypatch.setattr(config_utils, "_CONTENT_CACHE_MAX_ENTRIES", 2)
+        config_path = _write_cli_config(temp_directory)
+        text = config_path.read_text(encoding="utf-8")
+        load_config.cache_clear()
+
+        for chunk_size in (96, 960, 1200):
+            config_path.write_text(text.replace("chunk_size: 120", f"chunk_size: {chunk_size}"), encoding="utf-8")
+            load_config(str(config_path))
+
+        assert len(config_utils._CONTENT_CACHE) == 2
+
+    def test_load_config_only_resolves_whole_value_placeholders(self, temp_directory, monkeypatch):
+        config_path = _write_cli_config(temp_directory)
+        payload = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+        payload["llm"]["provider_config"]["api_key"] = "${RAG_TEST_UNSET_VAR}\n"
+        config_path.write_text(yaml.safe_dump(payload, sort_keys=False), encoding="utf-8")
+        monkeypatch.delenv("RAG_TEST_UNSET_VAR", raising=False)
+
+        config = load_config(str(config_path))
+
+        assert config.llm_provider_config["api_key"] == "${RAG_TEST_UNSET_VAR}\n"
+
+    @pytest.mark.parametrize(
+        ("file_name", "content", "message"),
+        [
+            ("list.yaml", "- not\n- a mapping\n", "expected a mapping"),
+            ("bad_value.json", '{"document_processing": {"chunk_size": -1}}', "Failed to load configuration"),
+            ("settings.toml", "chunk_size = 100\n", "Unsupported configuration file format"),
+        ],
+    )
+    def test_load_config_wraps_invalid_files(self, temp_directory, file_name, content, message):
+        config_path = Path(temp_directory) / file_name
+        config_path.write_text(content, encoding="utf-8")
+
+        with pytest.raises(ConfigurationError, match=message) as exc_info:
+            load_config(str(config_path))
+
+        assert exc_info.value.error_code == ErrorCode.CONFIG_INVALID
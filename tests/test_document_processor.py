@@ -83,6 +83,15 @@ class TestDocumentProcessor:
 
         assert exc_info.value.error_code == ErrorCode.DOCUMENT_INVALID_FORMAT
 
+    def test_chunks_from_one_document_share_creation_timestamp(self):
+        processor = DocumentProcessor(chunk_size=100, chunk_overlap=10)
+        chunks = processor.chunk_text("Shared timestamps keep serialization cheap. " * 20, "shared.txt")
+        serialized = [chunk.to_dict()["created_at"] for chunk in chunks]
+
+        assert len(chunks) > 1
+        assert all(chunk.created_at is chunks[0].created_at for chunk in chunks)
+        assert serialized == [chunks[0].created_at.isoformat()] * len(chunks)
+
 
 class TestDocumentProcessorProperties:
     @given(
@@ -2,6 +2,8 @@
 Unit tests for exception classes and error handling framework.
 """
 
+import traceback
+
 import pytest
 from src.exceptions import (
     RAGException, ErrorCode, ErrorHandler,
@@ -10,6 +12,9 @@ from src.exceptions import (
 )
 
 
+_LONG_QUERY = "very long query text" * 100
+
+
 class TestRAGException:
     """Test cases for RAGException base class."""
     
@@ -39,6 +44,14 @@ class TestRAGException:
         
         assert exception.details == details
     
+    def test_rag_exception_details_materialize_on_demand(self):
+        """Test that empty details serialize as a dict and accept later additions."""
+        exception = DocumentProcessingError("No file", ErrorCode.DOCUMENT_NOT_FOUND)
+        assert exception.to_dict()["details"] == {}
+        
+        exception.details["attempt"] = 2
+        assert exception.to_dict()["details"] == {"attempt": 2}
+    
     def test_rag_exception_with_cause(self):
         """Test RAGException with underlying cause."""
         original_error = ValueError("Original error")
@@ -51,6 +64,32 @@ class TestRAGException:
         
         assert exception.cause == original_error
     
+    def test_rag_exception_releases_cause_frame_locals(self):
+        """Test that wrapping a cause clears frame locals but keeps the traceback."""
+        def fail():
+            payload = ["x"] * 1000
+            raise ValueError("Original error")
+        
+        try:
+            fail()
+        except ValueError as exc:
+            exception = RAGException(
+                message="Wrapped error",
+                error_code=ErrorCode.SYSTEM_UNKNOWN_ERROR,
+                component="TestComponent",
+                cause=exc
+            )
+        
+        tb = exception.cause.__traceback__
+        while tb.tb_next is not None:
+            tb = tb.tb_next
+        assert tb.tb_frame.f_code.co_name == "fail"
+        assert "payload" not in tb.tb_frame.f_locals
+        
+        formatted = "".join(traceback.format_exception(type(exception.cause), exception.cause, exception.cause.__traceback__))
+        assert "in fail" in formatted
+        assert "ValueError: Original error" in formatted
+    
     def test_rag_exception_serialization(self):
         """Test RAGException to_dict method."""
         exception = RAGException(
@@ -68,6 +107,19 @@ class TestRAGException:
         assert exception_dict["details"] == {"key": "value"}
         assert exception_dict["cause"] is None
     
+    def test_rag_exception_to_dict_returns_independent_dicts(self):
+        """Test that to_dict keeps its key order and never shares state between calls."""
+        exception = DocumentProcessingError("Missing", ErrorCode.DOCUMENT_NOT_FOUND, "a.txt")
+        
+        first = exception.to_dict()
+        first["component"] = "Mutated"
+        first["details"]["file_path"] = "b.txt"
+        second = DocumentProcessingError("Missing", ErrorCode.DOCUMENT_NOT_FOUND, "c.txt").to_dict()
+        
+        assert list(second) == ["message", "error_code", "component", "details", "cause"]
+        assert second["component"] == "DocumentProcessor"
+        assert second["details"] == {"file_path": "c.txt"}
+    
     def test_rag_exception_string_representation(self):
         """Test RAGException string representation."""
         exception = RAGException(
@@ -121,12 +173,13 @@ class TestSpecificExceptions:
         error = QueryProcessingError(
             message="Query too long",
             error_code=ErrorCode.QUERY_TOO_LONG,
-            query="very long query text" * 100
+            query=_LONG_QUERY
         )
         
         assert error.component == "QueryProcessor"
         # Query should be truncated in details
         assert len(error.details["query"]) <= 103  # 100 + "..."
+        assert error.details["query"] == _LONG_QUERY[:100] + "..."
     
     def test_response_generation_error(self):
         """Test ResponseGenerationError creation."""
@@ -168,11 +221,12 @@ class TestErrorHandler:
     def test_error_handler_creation(self):
         """Test ErrorHandler creation."""
         handler = ErrorHandler()
-        assert handler.error_counts == {}
+        assert len(handler.error_counts) == 0
+        assert handler.get_error_statistics() == {}
     
-    def test_handle_rag_error(self):
+    def test_handle_rag_error(self, shared_error_handler):
         """Test handling of RAG-specific errors."""
-        handler = ErrorHandler()
+        handler = shared_error_handler
         error = DocumentProcessingError(
             message="File not found",
             error_code=ErrorCode.DOCUMENT_NOT_FOUND,
@@ -188,9 +242,9 @@ class TestErrorHandler:
         assert "recoverable" in response
         assert "retry_suggested" in response
     
-    def test_handle_generic_error(self):
+    def test_handle_generic_error(self, shared_error_handler):
         """Test handling of generic Python errors."""
-        handler = ErrorHandler()
+        handler = shared_error_handler
         error = ValueError("Generic error")
         
         response = handler.handle_error(error, {"context": "test"})
@@ -230,9 +284,20 @@ class TestErrorHandler:
         handler.reset_error_counts()
         assert handler.get_error_statistics() == {}
     
-    def test_recoverable_error_detection(self):
-        """Test detection of recoverable errors."""
+    def test_unknown_key_reads_do_not_grow_counts(self):
+        """Test that querying unseen error keys does not insert entries."""
         handler = ErrorHandler()
+        handler.handle_error(DocumentProcessingError("Error", ErrorCode.DOCUMENT_NOT_FOUND), {})
+        
+        for index in range(10_000):
+            assert handler.error_counts[f"Unknown:{index}"] == 0
+            assert handler.get_error_statistics().get(f"Unknown:{index}", 0) == 0
+        
+        assert len(handler.error_counts) == 1
+    
+    def test_recoverable_error_detection(self, shared_error_handler):
+        """Test detection of recoverable errors."""
+        handler = shared_error_handler
         
         # Test recoverable error
         recoverable_error = EmbeddingGenerationError(
@@ -266,6 +331,10 @@ class TestErrorCodes:
         assert ErrorCode.CONFIG_INVALID.value == "CFG_001"
         assert ErrorCode.SYSTEM_UNKNOWN_ERROR.value == "SYS_999"
     
+    def test_error_code_attribute_matches_value(self):
+        """Test that the pre-bound code attribute mirrors the enum value."""
+        assert all(code.code == code.value for code in ErrorCode)
+    
     def test_error_code_uniqueness(self):
         """Test that all error codes are unique."""
         error_codes = [code.value for code in ErrorCode]
@@ -0,0 +1,126 @@
+"""
+Tests for file discovery and file-handling helpers.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.utils import file_utils
+from src.utils.file_utils import backup_file, find_files, format_file_size
+
+
+def _write(path: Path, text: str = "content") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+class TestFindFiles:
+    def test_matches_pattern_recursively(self, tmp_path):
+        top = _write(tmp_path / "a.txt")
+        nested = _write(tmp_path / "nested" / "deeper" / "b.txt")
+        _write(tmp_path / "nested" / "c.pdf")
+
+        assert sorted(find_files(str(tmp_path), "*.txt")) == sorted([str(top), str(nested)])
+        assert len(find_files(str(tmp_path))) == 3
+
+    def test_non_recursive_mode_skips_subdirectories(self, tmp_path):
+        top = _write(tmp_path / "a.txt")
+        _write(tmp_path / "nested" / "b.txt")
+
+        assert find_files(str(tmp_path), "*.txt", recursive=False) == [str(top)]
+
+    def test_multi_component_patterns_use_path_matching(self, tmp_path):
+        nested = _write(tmp_path / "docs" / "b.txt")
+        _write(tmp_path / "other" / "c.txt")
+
+        assert find_files(str(tmp_path), os.path.join("docs", "*.txt")) == [str(nested)]
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks unavailable")
+    @pytest.mark.parametrize("recursive", [True, False])
+    def test_skips_broken_symlinks(self, tmp_path, recursive):
+        real = _write(tmp_path / "real.txt")
+        try:
+            os.symlink(tmp_path / "missing.txt", tmp_path / "broken.txt")
+        except (OSError, NotImplementedError):
+            pytest.skip("cannot create symlinks here")
+
+        assert find_files(str(tmp_path), "*.txt", recursive=recursive) == [str(real)]
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="FIFOs unavailable")
+    def test_skips_fifos(self, tmp_path):
+        real = _write(tmp_path / "real.txt")
+        os.mkfifo(tmp_path / "pipe.txt")
+
+        assert find_files(str(tmp_path), "*.txt") == [str(real)]
+
+    @pytest.mark.parametrize("recursive", [True, False])
+    def test_non_directory_arguments_return_nothing(self, tmp_path, recursive):
+        file_path = _write(tmp_path / "a.txt")
+
+        assert find_files(str(file_path), "*.txt", recursive=recursive) == []
+        assert find_files(str(tmp_path / "missing"), recursive=recursive) == []
+
+
+class TestFormatFileSize:
+    @pytest.mark.parametrize(
+        ("size_bytes", "expected"),
+        [
+            (0, "0 B"),
+            (-5, "-5.0 B"),
+            (-2048, "-2048.0 B"),
+            (1023, "1023.0 B"),
+            (1024, "1.0 KB"),
+            (2048.0, "2.0 KB"),
+            (1048575.9, "1024.0 KB"),
+            (1048576, "1.0 MB"),
+            (3 * 1024**3, "3.0 GB"),
+            (2 * 1024**4, "2.0 TB"),
+            (5 * 1024**5 + 0.5, "5120.0 TB"),
+        ],
+    )
+    def test_formats_int_and_float_sizes(self, size_bytes, expected):
+        assert format_file_size(size_bytes) == expected
+
+
+class TestBackupFile:
+    def test_default_backup_is_a_separate_copy(self, tmp_path):
+        source = _write(tmp_path / "notes.txt", "original")
+
+        backup = Path(backup_file(str(source), str(tmp_path / "backups")))
+
+        assert backup.parent == tmp_path / "backups"
+        assert backup.read_text(encoding="utf-8") == "original"
+        assert backup.stat().st_ino != source.stat().st_ino
+
+    @pytest.mark.skipif(not hasattr(os, "link"), reason="hard links unavailable")
+    def test_hardlink_backup_shares_the_source_inode(self, tmp_path):
+        source = _write(tmp_path / "notes.txt", "original")
+
+        backup = Path(backup_file(str(source), hardlink=True))
+
+        assert backup.parent == tmp_path
+        assert backup.stat().st_ino == source.stat().st_ino
+
+    def test_hardlink_falls_back_to_copy_when_link_fails(self, tmp_path, monkeypatch):
+        source = _write(tmp_path / "notes.txt", "original")
+        copies = []
+        real_copy2 = file_utils.shutil.copy2
+
+        def fail_link(*_args, **_kwargs):
+            raise OSError("cross-device link")
+
+        def record_copy2(src, dst):
+            copies.append((src, dst))
+            return real_copy2(src, dst)
+
+        monkeypatch.setattr(file_utils.os, "link", fail_link, raising=False)
+        monkeypatch.setattr(file_utils.shutil, "copy2", record_copy2)
+
+        backup = Path(backup_file(str(source), hardlink=True))
+
+        assert copies == [(source, backup)]
+        assert backup.read_text(encoding="utf-8") == "original"
+        assert backup.stat().st_ino != source.stat().st_ino
@@ -5,6 +5,7 @@ End-to-end integration and system validation tests for the RAG pipeline.
 from __future__ import annotations
 
 from concurrent.futures import ThreadPoolExecutor
+import os
 from pathlib import Path
 import string
 from typing import List
@@ -32,29 +33,36 @@ SAFE_DOCUMENT_TEXT = st.text(
 ).filter(lambda value: value.strip())
 
 
+# Settings shared by every pipeline built here; only the run directories vary.
+_PIPELINE_CONFIG_DEFAULTS = {
+    "embedding_provider": "openai",
+    "embedding_model": "text-embedding-3-small",
+    "llm_provider": "openai",
+    "llm_model": "gpt-4o-mini",
+    "chunk_size": 256,
+    "chunk_overlap": 32,
+    "max_context_length": 800,
+    "top_k_results": 1,
+    "similarity_threshold": 0.0,
+    "max_response_tokens": 240,
+    "temperature": 0.1,
+    "batch_size": 8,
+    "max_retries": 1,
+    "timeout_seconds": 20,
+}
+
+
 def _build_pipeline_config(temp_directory: str, **overrides: object) -> RAGConfig:
-    run_root = Path(temp_directory) / f"integration_{uuid4().hex}"
-    base = {
-        "embedding_provider": "openai",
-        "embedding_model": "text-embedding-3-small",
-        "llm_provider": "openai",
-        "llm_model": "gpt-4o-mini",
-        "chunk_size": 256,
-        "chunk_overlap": 32,
-        "max_context_length": 800,
-        "top_k_results": 1,
-        "similarity_threshold": 0.0,
-        "max_response_tokens": 240,
-        "temperature": 0.1,
-        "batch_size": 8,
-        "max_retries": 1,
-        "timeout_seconds": 20,
-        "data_directory": str(run_root / "data"),
-        "embeddings_directory": str(run_root / "embeddings"),
-        "logs_directory": str(run_root / "logs"),
-    }
-    base.update(overrides)
-    return RAGConfig(**base)
+    run_root = os.path.join(temp_directory, f"integration_{uuid4().hex}")
+    return RAGConfig(
+        **{
+            **_PIPELINE_CONFIG_DEFAULTS,
+            "data_directory": os.path.join(run_root, "data"),
+            "embeddings_directory": os.path.join(run_root, "embeddings"),
+            "logs_directory": os.path.join(run_root, "logs"),
+            **overrides,
+        }
+    )
 
 
 def _build_pipeline(
@@ -81,6 +89,14 @@ def _write_documents(root: Path, contents: List[str]) -> List[str]:
     return file_paths
 
 
+class TestProjectPackaging:
+    def test_requirements_declare_runtime_and_test_dependencies(self, requirements_packages):
+        expected = {"numpy", "faiss-cpu", "openai", "pypdf2", "pyyaml", "orjson", "pytest", "hypothesis"}
+
+        missing = expected - requirements_packages
+        assert not missing, f"Missing from requirements.txt: {sorted(missing)}"
+
+
 @pytest.mark.integration
 class TestEndToEndSystemValidation:
     def test_complete_pipeline_with_sample_documents_and_queries(self, temp_directory):
@@ -208,6 +224,7 @@ class TestEndToEndSystemValidation:
 
 @pytest.mark.integration
 @pytest.mark.property
+@pytest.mark.xdist_group(name="integration_properties")
 class TestIntegrationProperties:
     @INTEGRATION_PROPERTY_SETTINGS
     @given(
@@ -0,0 +1,56 @@
+"""
+Tests for the LoggerMixin logger cache and log helpers.
+"""
+
+import logging
+
+import pytest
+
+from src.utils.logging_utils import LoggerMixin
+
+
+class _ParentComponent(LoggerMixin):
+    pass
+
+
+class _ChildComponent(_ParentComponent):
+    pass
+
+
+class TestLoggerMixin:
+    def test_subclass_gets_its_own_logger(self):
+        parent_logger = _ParentComponent().logger
+        child_logger = _ChildComponent().logger
+
+        assert parent_logger.name == "rag_digital_twin._ParentComponent"
+        assert child_logger.name == "rag_digital_twin._ChildComponent"
+        assert _ParentComponent().logger is parent_logger
+        assert _ChildComponent.__dict__["_logger"] is child_logger
+
+    def test_disabled_levels_emit_nothing(self, caplog, monkeypatch):
+        component = _ParentComponent()
+        caplog.set_level(logging.WARNING, logger=component.logger.name)
+
+        def fail(*_args, **_kwargs):
+            pytest.fail("disabled level reached the logger")
+
+        monkeypatch.setattr(component.logger, "info", fail)
+        monkeypatch.setattr(component.logger, "debug", fail)
+
+        component.log_info("skipped", request_id="abc")
+        component.log_debug("skipped")
+
+        assert caplog.records == []
+
+    def test_keyword_arguments_become_record_extras(self, caplog):
+        component = _ChildComponent()
+        caplog.set_level(logging.INFO, logger=component.logger.name)
+
+        component.log_warning("slow query", request_id="abc", elapsed_ms=12)
+        component.log_info("plain")
+
+        warning, info = caplog.records
+        assert (warning.levelno, warning.getMessage()) == (logging.WARNING, "slow query")
+        assert (warning.request_id, warning.elapsed_ms) == ("abc", 12)
+        assert info.getMessage() == "plain"
+        assert not hasattr(info, "request_id")
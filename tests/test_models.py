@@ -2,18 +2,111 @@
 Unit tests for core data models in the RAG Digital Twin system.
 """
 
+import dataclasses
+import os
+import sys
 import pytest
 from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
 from hypothesis import given, strategies as st
 
+import src.models
 from src.models.document_chunk import DocumentChunk
 from src.models.embedding_metadata import EmbeddingMetadata
-from src.models.rag_config import RAGConfig
+from src.models.rag_config import RAGConfig, _VALIDATION_RULES
 from src.models.search_results import SearchResults, QueryResults, RetrievedContext, GeneratedResponse
 from src.models.system_status import SystemStatus, IngestionResults, SystemHealth
 from src.exceptions import ConfigurationError, ErrorCode
 
 
+# A character str.strip() never removes: every whitespace code point is in
+# one of these categories (surrogates are excluded as unencodable).
+_NON_BLANK_CHAR = st.characters(blacklist_categories=("Cs", "Cc", "Zs", "Zl", "Zp"))
+
+
+def _non_blank_text(max_size: int):
+    """Text of 1..max_size characters that is valid by construction (never all whitespace)."""
+    half = (max_size - 1) // 2
+    return st.builds(
+        lambda prefix, anchor, suffix: prefix + anchor + suffix,
+        st.text(max_size=half),
+        _NON_BLANK_CHAR,
+        st.text(max_size=max_size - 1 - half),
+    )
+
+
+_NONEMPTY_TEXT = _non_blank_text(1000)
+_NONEMPTY_PATH = _non_blank_text(100)
+
+
+# One violating update per RAGConfig validation rule, keyed by the rule's
+# message template; the parity test fails if a rule is added without a case.
+_RULE_VIOLATIONS = {
+    "Invalid embedding provider: {0.embedding_provider}": {"embedding_provider": "not-a-provider"},
+    "Invalid LLM provider: {0.llm_provider}": {"llm_provider": "not-a-provider"},
+    "Embedding model must be specified": {"embedding_model": ""},
+    "LLM model must be specified": {"llm_model": ""},
+    "Embedding provider config must be a dictionary": {"embedding_provider_config": []},
+    "LLM provider config must be a dictionary": {"llm_provider_config": []},
+    "Embedding fallbacks must be a list": {"embedding_fallbacks": {}},
+    "LLM fallbacks must be a list": {"llm_fallbacks": {}},
+    "Chunk size must be positive": {"chunk_size": 0},
+    "Chunk overlap cannot be negative": {"chunk_overlap": -1},
+    "Chunk overlap must be less than chunk size": {"chunk_size": 100, "chunk_overlap": 100},
+    "Max context length must be positive": {"max_context_length": 0},
+    "Top-k results must be positive": {"top_k_results": 0},
+    "Similarity threshold must be between 0.0 and 1.0": {"similarity_threshold": 1.5},
+    "Max response tokens must be positive": {"max_response_tokens": 0},
+    "Temperature must be between 0.0 and 2.0": {"temperature": 2.5},
+    "Batch size must be positive": {"batch_size": 0},
+    "Max retries cannot be negative": {"max_retries": -1},
+    "Timeout seconds must be positive": {"timeout_seconds": 0},
+}
+
+
+class TestModelsPackage:
+    """Test cases for the lazily-populated models package."""
+    
+    def test_lazy_exports_resolve_to_model_classes(self):
+        """Test that package-level names resolve to the defining modules' classes."""
+        assert src.models.RAGConfig is RAGConfig
+        assert src.models.QueryResults is QueryResults
+        assert src.models.IngestionResults is IngestionResults
+        assert set(src.models.__all__) <= set(dir(src.models))
+    
+    @pytest.mark.parametrize("model_factory", [
+        lambda: DocumentChunk(content="content", source_file="test.txt"),
+        lambda: EmbeddingMetadata(chunk_id="id", source_file="test.txt", content_preview="p", embedding_model="m"),
+        lambda: RAGConfig(),
+    ])
+    def test_generated_to_dict_covers_public_fields(self, model_factory):
+        """Test that generated to_dict emits every public dataclass field in order."""
+        model = model_factory()
+        public_fields = [f.name for f in dataclasses.fields(model) if not f.name.startswith("_")]
+        
+        assert list(model.to_dict()) == public_fields
+    
+    @pytest.mark.parametrize("model_factory", [
+        lambda: DocumentChunk(content="content", source_file="test.txt", metadata={"page": 2}, embedding_id=7),
+        lambda: EmbeddingMetadata(chunk_id="id", source_file="test.txt", content_preview="p", embedding_model="m"),
+    ])
+    def test_generated_from_dict_round_trips_and_fills_defaults(self, model_factory):
+        """Test that generated from_dict inverts to_dict and applies field defaults."""
+        model = model_factory()
+        data = model.to_dict()
+        
+        assert type(model).from_dict(data) == model
+        
+        data["created_at"] = None
+        assert isinstance(type(model).from_dict(data).created_at, datetime)
+    
+    def test_unknown_attribute_raises(self):
+        """Test that unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            src.models.NotAModel
+
+
 class TestDocumentChunk:
     """Test cases for DocumentChunk model."""
     
@@ -60,6 +153,48 @@ class TestDocumentChunk:
         # Test with content shorter than max_length
         short_preview = chunk.get_content_preview(1000)
         assert short_preview == chunk.content
+    
+    def test_content_preview_is_reused_and_tracks_content(self):
+        """Test that previews are cached per length and refreshed when content changes."""
+        chunk = DocumentChunk(content="x" * 150, source_file="test.txt")
+        preview = chunk.get_content_preview()
+        
+        assert preview == "x" * 100 + "..."
+        assert chunk.get_content_preview() is preview
+        assert EmbeddingMetadata.from_document_chunk(chunk, "model").content_preview is preview
+        assert chunk.get_content_preview(10) == "x" * 10 + "..."
+        
+        chunk.content = "replacement content"
+        assert chunk.get_content_preview() == "replacement content"
+    
+    def test_generated_chunk_ids_are_unique_hex(self):
+        """Test that default chunk IDs are unique 32-character hex tokens."""
+        chunk_ids = {
+            DocumentChunk(content="content", source_file="test.txt").chunk_id
+            for _ in range(1000)
+        }
+        
+        assert len(chunk_ids) == 1000
+        assert all(len(chunk_id) == 32 for chunk_id in chunk_ids)
+        assert all(int(chunk_id, 16) >= 0 for chunk_id in chunk_ids)
+    
+    def test_repeated_source_files_are_interned(self):
+        """Test that chunks and metadata from one file share a single path string."""
+        first = DocumentChunk(content="a", source_file="".join(["shared", "/doc.txt"]))
+        second = DocumentChunk(content="b", source_file="".join(["shared", "/doc.txt"]))
+        metadata = EmbeddingMetadata.from_document_chunk(first, "".join(["model", "-a"]))
+        
+        assert first.source_file is second.source_file
+        assert metadata.source_file is first.source_file
+        assert metadata.embedding_model is sys.intern("model-a")
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+")
+    def test_per_chunk_models_use_slots(self, sample_document_chunk, sample_embedding_metadata):
+        """Test that high-volume models do not carry a per-instance __dict__."""
+        assert not hasattr(sample_document_chunk, "__dict__")
+        assert not hasattr(sample_embedding_metadata, "__dict__")
+        with pytest.raises(AttributeError):
+            sample_document_chunk.unexpected_attribute = True
 
 
 class TestEmbeddingMetadata:
@@ -142,6 +277,77 @@ class TestRAGConfig:
         assert updated_config.chunk_size == 2000
         assert updated_config.top_k_results == 10
         assert updated_config.embedding_provider == config.embedding_provider  # Unchanged
+        assert config.chunk_size == 500  # Original left untouched
+    
+    def test_config_is_frozen_and_to_dict_returns_copies(self, sample_rag_config):
+        """Test that configs are immutable and callers cannot corrupt the cached dict."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            sample_rag_config.chunk_size = 10
+        
+        first = sample_rag_config.to_dict()
+        first["chunk_size"] = 10
+        assert sample_rag_config.to_dict()["chunk_size"] == 500
+        assert sample_rag_config.update(chunk_size=700).to_dict()["chunk_size"] == 700
+    
+    def test_config_update_copies_fields_and_interns_names(self, sample_rag_config):
+        """Test that update copies every field and interns updated model names."""
+        model_name = "".join(["gpt-", "custom"])
+        updated = sample_rag_config.update(llm_model=model_name)
+        
+        assert updated.llm_model is sys.intern("gpt-custom")
+        assert updated == dataclasses.replace(sample_rag_config, llm_model="gpt-custom")
+        assert updated.to_dict()["llm_model"] == "gpt-custom"
+    
+    def test_config_update_validates_changed_fields(self, sample_rag_config):
+        """Test that update re-checks rules touching the changed fields."""
+        with pytest.raises(ValueError, match="Chunk overlap must be less than chunk size"):
+            sample_rag_config.update(chunk_size=sample_rag_config.chunk_overlap)
+        with pytest.raises(ValueError, match="Invalid LLM provider"):
+            sample_rag_config.update(llm_provider="invalid_provider")
+        with pytest.raises(ConfigurationError):
+            sample_rag_config.update(embedding_provider_config={"unsupported": True})
+        with pytest.raises(TypeError, match="Unknown RAGConfig fields"):
+            sample_rag_config.update(not_a_field=1)
+    
+    @pytest.mark.parametrize(
+        "rule", _VALIDATION_RULES, ids=[message for _fields, _check, message in _VALIDATION_RULES]
+    )
+    def test_update_and_full_validation_report_the_same_error(self, sample_rag_config, rule):
+        """Test that every partial update rule mirrors the inline full validation."""
+        _watched_fields, _is_valid, message = rule
+        assert message in _RULE_VIOLATIONS, f"No violating value for rule: {message}"
+        changes = _RULE_VIOLATIONS[message]
+        
+        with pytest.raises(ValueError) as full_error:
+            RAGConfig.from_dict({**sample_rag_config.to_dict(), **changes})
+        with pytest.raises(ValueError) as partial_error:
+            sample_rag_config.update(**changes)
+        
+        assert message.format(SimpleNamespace(**{**sample_rag_config.to_dict(), **changes})) in str(full_error.value)
+        assert str(partial_error.value) == str(full_error.value)
+    
+    def test_validation_rule_cases_cover_every_watched_field(self):
+        """Test that the parity cases exercise each field a rule reads."""
+        watched = frozenset().union(*(fields for fields, _check, _message in _VALIDATION_RULES))
+        covered = frozenset().union(*_RULE_VIOLATIONS.values())
+        
+        assert watched <= covered
+        assert set(_RULE_VIOLATIONS) == {message for _fields, _check, message in _VALIDATION_RULES}
+    
+    def test_json_file_round_trip_reflects_edits(self, sample_rag_config, temp_directory):
+        """Test that cached JSON loads are isolated and invalidated on change."""
+        config_path = Path(temp_directory) / "config.json"
+        sample_rag_config.to_json_file(str(config_path))
+        
+        first = RAGConfig.from_json_file(str(config_path))
+        first.embedding_provider_config["mutated"] = True
+        second = RAGConfig.from_json_file(str(config_path))
+        assert second.chunk_size == sample_rag_config.chunk_size
+        assert "mutated" not in second.embedding_provider_config
+        
+        sample_rag_config.update(chunk_size=750).to_json_file(str(config_path))
+        os.utime(config_path, ns=(0, 10**18))
+        assert RAGConfig.from_json_file(str(config_path)).chunk_size == 750
 
 
 class TestSearchResults:
@@ -222,6 +428,41 @@ class TestIngestionResults:
         expected_rate = 3 / 5  # 3 successful out of 5 total
         assert results.get_success_rate() == expected_rate
     
+    def test_error_messages_are_formatted_on_read(self):
+        """Test that document and batch-level errors format consistently."""
+        results = IngestionResults(total_documents=1)
+        assert not results.has_errors()
+        
+        results.add_failed_document("doc.txt", "Invalid format")
+        results.add_error("Vector store unavailable")
+        
+        assert results.has_errors()
+        assert results.errors == ("doc.txt: Invalid format", "Vector store unavailable")
+        assert results.to_dict()["errors"] == list(results.errors)
+        assert "Vector store unavailable" in repr(results)
+        with pytest.raises(AttributeError):
+            results.errors.append("lost")
+    
+    def test_equality_compares_formatted_errors(self):
+        """Test that results are equal however their errors were recorded."""
+        seeded = IngestionResults(total_documents=1, failed_documents=1, errors=["a: b"], failed_files=["a"])
+        recorded = IngestionResults(total_documents=1)
+        recorded.add_failed_document("a", "b")
+        
+        assert seeded == recorded
+        recorded.add_error("late failure")
+        assert seeded != recorded
+    
+    def test_errors_init_parameter_is_kept(self):
+        """Test that errors can still be passed by keyword or position."""
+        by_keyword = IngestionResults(total_documents=1, errors=["Startup failed"])
+        by_position = IngestionResults(1, 0, 0, 0, 0, 0.0, ["Startup failed"], ["a.txt"])
+        
+        assert by_keyword.has_errors()
+        assert by_keyword.errors == ("Startup failed",)
+        assert by_position.errors == ("Startup failed",)
+        assert by_position.processed_files == ["a.txt"]
+    
     def test_ingestion_results_serialization(self, sample_ingestion_results):
         """Test IngestionResults serialization."""
         results = sample_ingestion_results
@@ -234,12 +475,13 @@ class TestIngestionResults:
 
 
 # Property-based tests
+@pytest.mark.xdist_group(name="models_properties")
 class TestModelProperties:
     """Property-based tests for data models."""
     
     @given(
-        content=st.text(min_size=1, max_size=1000).filter(lambda x: x.strip()),
-        source_file=st.text(min_size=1, max_size=100).filter(lambda x: x.strip())
+        content=_NONEMPTY_TEXT,
+        source_file=_NONEMPTY_PATH
     )
     def test_document_chunk_content_preservation(self, content, source_file):
         """Property: DocumentChunk should preserve content exactly."""
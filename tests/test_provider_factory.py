@@ -106,6 +106,26 @@ class TestProviderFactory:
         assert len(vector) == 10
         assert provider.get_config()["provider"] == "echo-embedding"
 
+    def test_provider_support_checks_follow_the_live_registry(self):
+        assert ProviderFactory.is_llm_provider_supported("openai")
+        assert not ProviderFactory.is_embedding_provider_supported("echo-registry-check")
+        assert not ProviderFactory.is_embedding_provider_supported(["openai"])
+
+        ProviderFactory.register_embedding_provider(
+            provider_name="echo-registry-check",
+            provider_class=EchoEmbeddingProvider,
+            default_model_name="echo-embedding-model",
+            supported_kwargs={"dimension"},
+        )
+
+        assert ProviderFactory.is_embedding_provider_supported("echo-registry-check")
+        config = RAGConfig(
+            embedding_provider="echo-registry-check",
+            embedding_model="echo-embedding-model",
+            embedding_provider_config={"dimension": 10},
+        )
+        assert config.embedding_provider == "echo-registry-check"
+
     def test_invalid_provider_specific_config_raises_configuration_error(self):
         with pytest.raises(ConfigurationError) as exc_info:
             ProviderFactory.create_embedding_provider(